@@ -8,18 +8,49 @@ Exports all available data first, then allows users to select/deselect columns p
 import sys
 import subprocess
 import importlib
+import importlib.util
 import os
 
+# Written next to the script once all required packages are present
+DEPS_SENTINEL = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.deps_ok')
+
+def deps_sentinel_is_fresh():
+    """Check if a previous run already verified packages for this version of the script"""
+    try:
+        return os.path.getmtime(DEPS_SENTINEL) > os.path.getmtime(os.path.abspath(__file__))
+    except OSError:
+        return False
+
+def write_deps_sentinel():
+    """Record that required packages are installed (best effort)"""
+    try:
+        with open(DEPS_SENTINEL, 'w') as f:
+            f.write('ok\n')
+    except OSError:
+        pass  # Read-only install location - just probe again next time
+
 def check_and_install_packages():
     """Check and install required packages automatically"""
-    print("🔍 Checking required packages...")
-    
     # Define required packages (pyautogui is optional - will be installed when needed for PowerBI)
     required_packages = {
         'requests': 'requests',
         'pandas': 'pandas'
     }
     
+    # Warm start: packages were verified on a previous run - the find_spec probe is cheap, so it
+    # still runs every time and the sentinel only skips the install/report work below
+    all_present = all(importlib.util.find_spec(name) is not None for name in required_packages)
+    if all_present and deps_sentinel_is_fresh():
+        return True
+    if not all_present:
+        # A package was removed since the sentinel was written - forget it
+        try:
+            os.remove(DEPS_SENTINEL)
+        except OSError:
+            pass
+    
+    print("🔍 Checking required packages...")
+    
     # Optional packages that enhance functionality
     optional_packages = {
         'pyautogui': 'pyautogui'  # Used for PowerBI automation
@@ -34,12 +65,11 @@ def check_and_install_packages():
     
     missing_packages = []
     
-    # Check each required package
+    # Check each required package (find_spec locates the module without importing it)
     for module_name, package_name in required_packages.items():
-        try:
-            importlib.import_module(module_name)
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✅ {module_name} - already installed")
-        except ImportError:
+        else:
             print(f"❌ {module_name} - not found")
             missing_packages.append(package_name)
     
@@ -67,14 +97,14 @@ def check_and_install_packages():
                 return False
     
     print("✅ All required packages are ready!")
+    write_deps_sentinel()
     
     # Check optional packages (don't block startup if missing)
     print("\n🔍 Checking optional packages...")
     for module_name, package_name in optional_packages.items():
-        try:
-            importlib.import_module(module_name)
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✅ {module_name} - available (enhanced PowerBI automation)")
-        except ImportError:
+        else:
             print(f"ℹ️ {module_name} - not installed (PowerBI automation will offer to install it)")
     
     return True
@@ -91,83 +121,90 @@ if __name__ == "__main__":
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 import csv
 import pandas as pd
-from datetime import datetime
+from datetime import datetime, timedelta
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 import webbrowser
 import urllib.parse
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import socket
+import base64
 from urllib.parse import parse_qs, urlparse
 import traceback
 import time
 import zipfile
+import gzip
 import sys
 import random
-from collections import deque
+import re
+import heapq
+import queue
+import shutil
+import operator
 
 class RateLimiter:
     """Rate limiter for Microsoft Graph API calls"""
     
+    # Fixed attribute set - read on every Graph request
+    __slots__ = ('requests_per_minute', 'requests_per_second', 'minute_tokens', 'second_tokens',
+                 'minute_rate', 'second_rate', 'last_refill', 'last_429_time', 'throttle_until', '_lock')
+    
     def __init__(self, requests_per_minute=600, requests_per_second=10):
         """
         Setup rate limiting - default 600/min, 10/sec for Graph API
         """
         self.requests_per_minute = requests_per_minute
         self.requests_per_second = requests_per_second
-        self.minute_requests = deque()
-        self.second_requests = deque()
+        # Token buckets - start full, refill continuously at the allowed rate
+        self.minute_tokens = float(requests_per_minute)
+        self.second_tokens = float(requests_per_second)
+        self.minute_rate = requests_per_minute / 60.0
+        self.second_rate = float(requests_per_second)
+        self.last_refill = time.monotonic()
         self.last_429_time = None
         self.throttle_until = None
+        self._lock = threading.Lock()  # Requests come from several worker threads
     
     def wait_if_needed(self):
         """Wait before request if we're hitting limits"""
-        import time
-        from datetime import datetime, timedelta
-        
-        now = datetime.now()
+        with self._lock:
+            self._wait_if_needed()
+    
+    def _wait_if_needed(self):
+        # Timestamps are time.monotonic() floats - no datetime/timedelta allocations per call
+        now = time.monotonic()
         
         # Still throttled from previous 429 response
         if self.throttle_until and now < self.throttle_until:
-            wait_time = (self.throttle_until - now).total_seconds()
+            wait_time = self.throttle_until - now
             if wait_time > 0:
                 time.sleep(wait_time)
-        
-        # Clean old requests (older than 1 minute)
-        cutoff_minute = now - timedelta(minutes=1)
-        while self.minute_requests and self.minute_requests[0] < cutoff_minute:
-            self.minute_requests.popleft()
-        
-        # Clean old requests (older than 1 second)
-        cutoff_second = now - timedelta(seconds=1)
-        while self.second_requests and self.second_requests[0] < cutoff_second:
-            self.second_requests.popleft()
-        
-        # Check per-minute limit
-        if len(self.minute_requests) >= self.requests_per_minute:
-            sleep_time = 60 - (now - self.minute_requests[0]).total_seconds()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        
-        # Check per-second limit
-        if len(self.second_requests) >= self.requests_per_second:
-            sleep_time = 1 - (now - self.second_requests[0]).total_seconds()
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        
-        # Record this request
-        current_time = datetime.now()
-        self.minute_requests.append(current_time)
-        self.second_requests.append(current_time)
+                now = time.monotonic()
+        
+        # Refill both buckets for the time elapsed since the last request
+        elapsed = now - self.last_refill
+        self.last_refill = now
+        self.minute_tokens = min(self.requests_per_minute, self.minute_tokens + elapsed * self.minute_rate)
+        self.second_tokens = min(self.requests_per_second, self.second_tokens + elapsed * self.second_rate)
+        
+        # Sleep until both buckets hold a whole token
+        if self.minute_tokens < 1 or self.second_tokens < 1:
+            sleep_time = max((1 - self.minute_tokens) / self.minute_rate,
+                             (1 - self.second_tokens) / self.second_rate)
+            time.sleep(sleep_time)
+        
+        # Spend a token (may go negative, the next refill counts the sleep above)
+        self.minute_tokens -= 1
+        self.second_tokens -= 1
     
     def handle_429_response(self, response):
         """Handle 429 rate limit response"""
-        import time
-        from datetime import datetime, timedelta
-        
         # Get retry-after header (in seconds)
         retry_after = response.headers.get('Retry-After', '60')
         try:
@@ -179,15 +216,22 @@ class RateLimiter:
         jitter = random.uniform(0.1, 0.3) * retry_seconds
         total_wait = retry_seconds + jitter
         
-        # Set throttle state
-        self.throttle_until = datetime.now() + timedelta(seconds=total_wait)
-        self.last_429_time = datetime.now()
+        # Set throttle state (monotonic deadline, same clock as wait_if_needed)
+        with self._lock:
+            now = time.monotonic()
+            self.throttle_until = now + total_wait
+            self.last_429_time = now
         
         return total_wait
 
 class TimeoutManager:
     """Manages timeouts for different API operations"""
     
+    __slots__ = ()  # Stateless - everything lives on the class
+    
+    # Default retry delays (1s doubling, capped at 60s) - attempts past the end stay at 60s
+    BACKOFF_DELAYS = tuple(min(2 ** attempt, 60) for attempt in range(7))
+    
     @staticmethod
     def get_timeout_for_operation(operation_type, estimated_records=None):
         """Get timeout value based on operation type and data size"""
@@ -221,10 +265,32 @@ class TimeoutManager:
     @staticmethod
     def get_exponential_backoff_delay(attempt, base_delay=1, max_delay=60):
         """Calculate retry delay with random component"""
-        delay = min(base_delay * (2 ** attempt), max_delay)
+        if base_delay == 1 and max_delay == 60:
+            delay = TimeoutManager.BACKOFF_DELAYS[min(attempt, len(TimeoutManager.BACKOFF_DELAYS) - 1)]
+        else:
+            delay = min(base_delay * (2 ** attempt), max_delay)
         jitter = random.uniform(0.1, 0.3) * delay
         return delay + jitter
 
+# OAuth callback pages - built once at import instead of on every callback
+_AUTH_OK_HTML = b"""
+            <html>
+                <body style='font-family: Arial; text-align: center; margin-top: 100px;'>
+                    <h2 style='color: green;'>Authentication Successful!</h2>
+                    <p>You can close this window and return to the application.</p>
+                </body>
+            </html>
+            """
+
+_AUTH_FAIL_TEMPLATE = """
+            <html>
+                <body style='font-family: Arial; text-align: center; margin-top: 100px;'>
+                    <h2 style='color: red;'>Authentication Failed!</h2>
+                    <p>Error: {error}</p>
+                </body>
+            </html>
+            """
+
 class AuthCallbackHandler(BaseHTTPRequestHandler):
     """Handle OAuth callback"""
     def do_GET(self):
@@ -233,45 +299,68 @@ class AuthCallbackHandler(BaseHTTPRequestHandler):
         
         if 'code' in query_params:
             self.server.auth_code = query_params['code'][0]
+            self.server.callback_received = True
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
             self.end_headers()
-            self.wfile.write(b"""
-            <html>
-                <body style='font-family: Arial; text-align: center; margin-top: 100px;'>
-                    <h2 style='color: green;'>Authentication Successful!</h2>
-                    <p>You can close this window and return to the application.</p>
-                </body>
-            </html>
-            """)
+            self.wfile.write(_AUTH_OK_HTML)
         else:
             self.server.auth_code = None
+            # Only an OAuth error ends the wait - stray requests (e.g. /favicon.ico) are ignored
+            self.server.callback_received = 'error' in query_params
             self.send_response(400)
             self.send_header('Content-type', 'text/html')
             self.end_headers()
             error_desc = query_params.get('error_description', ['Unknown error'])[0]
-            self.wfile.write(f"""
-            <html>
-                <body style='font-family: Arial; text-align: center; margin-top: 100px;'>
-                    <h2 style='color: red;'>Authentication Failed!</h2>
-                    <p>Error: {error_desc}</p>
-                </body>
-            </html>
-            """.encode())
+            self.wfile.write(_AUTH_FAIL_TEMPLATE.format(error=error_desc).encode())
     
     def log_message(self, format, *args):
         pass
 
+# ttk styles are process-wide, so the viewer Treeview style only needs configuring once
+_STYLE_CONFIGURED = False
+
+
+def make_row_projector(columns):
+    """Build a callable picking the given columns from a row dict, in order (missing keys become '')"""
+    if not columns:
+        return lambda row: ()
+    getter = operator.itemgetter(*columns)
+    single_column = len(columns) == 1
+    
+    def project(row):
+        try:
+            values = getter(row)
+        except KeyError:
+            # Sparse row - fall back to per-key defaults
+            return [row.get(column, '') for column in columns]
+        return (values,) if single_column else values
+    return project
+
+
 class ReportViewer:
     """A dedicated window for viewing report data in a table format"""
     
-    def __init__(self, parent, report_name, data, columns):
+    def __init__(self, parent, report_name, data, columns, records=None):
         self.parent = parent
         self.report_name = report_name
+        # Normalise to a DataFrame once so display and export work column-wise
+        self.records = records  # Original list-of-dicts rows, streamed straight to CSV on export
+        if data is None:
+            data = pd.DataFrame()
+        elif not hasattr(data, 'iterrows'):
+            self.records = data
+            data = pd.DataFrame(data, dtype=object)  # object dtype keeps ints/strings as-is
         self.data = data
+        self.row_count = 0 if data.empty else len(data)  # Checked once, reused by every handler
         self.columns = columns
         self.viewer_window = None
         
+        # Virtual scrolling state - the tree only holds the rows currently on screen
+        self.display_columns = []
+        self.top_row = 0
+        self.visible_rows = 20
+        
         self.create_viewer_window()
     
     def create_viewer_window(self):
@@ -350,12 +439,7 @@ class ReportViewer:
         title_label.pack(side='left', padx=20, pady=15)
         
         # Record count label
-        record_count = 0
-        if self.data is not None:
-            if hasattr(self.data, 'empty'):  # DataFrame
-                record_count = len(self.data) if not self.data.empty else 0
-            else:  # List or other iterable
-                record_count = len(self.data) if self.data else 0
+        record_count = self.row_count
         
         count_label = tk.Label(header_frame, text=f"📈 {record_count:,} records", 
                               font=('Segoe UI', 10), 
@@ -411,91 +495,115 @@ class ReportViewer:
         display_columns = self.columns[:50] if len(self.columns) > 50 else self.columns  # Limit columns for performance
         self.tree['columns'] = display_columns
         
-        # Configure column headings and widths
-        for col in display_columns:
+        # Work out column widths from header length before any Tk calls (minimum 100px)
+        column_widths = [max(len(col) * 8, 100) for col in display_columns]
+        
+        # Configure column headings and fixed widths (no stretch recalculation on insert/resize)
+        for col, width in zip(display_columns, column_widths):
             self.tree.heading(col, text=col, anchor='w')
-            # Set dynamic column width based on content length
-            max_width = max(len(col) * 8, 100)  # Minimum 100px
-            self.tree.column(col, width=max_width, minwidth=80, anchor='w')
+            self.tree.column(col, width=width, minwidth=80, anchor='w', stretch=False)
         
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.tree.yview)
+        # Add scrollbars (vertical scrolling moves through self.data, not the tree)
+        self.v_scrollbar = ttk.Scrollbar(table_frame, orient='vertical', command=self.on_vertical_scroll)
         h_scrollbar = ttk.Scrollbar(table_frame, orient='horizontal', command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
+        
+        # Mouse wheel (Windows/macOS and X11) and resizes re-render the visible window
+        self.tree.bind('<MouseWheel>', self.on_mousewheel)
+        self.tree.bind('<Button-4>', self.on_mousewheel)
+        self.tree.bind('<Button-5>', self.on_mousewheel)
+        self.tree.bind('<Configure>', self.on_tree_resize)
         
         # Pack scrollbars and treeview
-        v_scrollbar.pack(side='right', fill='y')
+        self.v_scrollbar.pack(side='right', fill='y')
         h_scrollbar.pack(side='bottom', fill='x')
         self.tree.pack(side='left', fill='both', expand=True)
         
         # Populate data
         self.populate_data(display_columns)
         
-        # Configure treeview styling
-        style = ttk.Style()
-        style.configure("Treeview", rowheight=25, font=('Segoe UI', 9))
-        style.configure("Treeview.Heading", font=('Segoe UI', 9, 'bold'))
+        # Configure treeview styling (first viewer only)
+        global _STYLE_CONFIGURED
+        if not _STYLE_CONFIGURED:
+            style = ttk.Style()
+            style.configure("Treeview", rowheight=25, font=('Segoe UI', 9))
+            style.configure("Treeview.Heading", font=('Segoe UI', 9, 'bold'))
+            _STYLE_CONFIGURED = True
     
     def populate_data(self, display_columns):
         """Populate the treeview with data"""
-        # Check if data is empty - handle both DataFrame and list
-        data_is_empty = False
-        if self.data is None:
-            data_is_empty = True
-        elif hasattr(self.data, 'empty'):  # DataFrame
-            data_is_empty = self.data.empty
-        else:  # List or other iterable
-            data_is_empty = len(self.data) == 0
-            
-        if data_is_empty:
+        self.display_columns = display_columns
+        self.top_row = 0
+        
+        if not self.row_count:
             # No data available
             self.tree.insert('', 'end', values=['No data available'] + [''] * (len(display_columns) - 1))
             return
         
-        # Add data rows (limit to first 1000 for performance)
-        max_rows = min(len(self.data), 1000)
-        
-        # Different handling for DataFrame vs dict
-        if hasattr(self.data, 'iterrows'):  # It's a pandas DataFrame
-            for i, (index, row) in enumerate(self.data.head(max_rows).iterrows()):
-                values = []
-                for col in display_columns:
-                    value = row.get(col, '') if col in row else ''
-                    # Convert to string and limit length
-                    str_value = str(value)[:100] if value is not None else ''
-                    values.append(str_value)
-                
-                self.tree.insert('', 'end', values=values)
-        else:  # It's list of dicts (traditional CSV data)
-            for i, row in enumerate(self.data[:max_rows]):
-                values = []
-                for col in display_columns:
-                    value = row.get(col, '') if isinstance(row, dict) else ''
-                    # Convert to string and limit length
-                    str_value = str(value)[:100] if value is not None else ''
-                    values.append(str_value)
-                
-                self.tree.insert('', 'end', values=values)
+        # All records are reachable - only the visible window is rendered
+        self.render_visible_rows()
         
-        # Update status if data was truncated
-        if len(self.data) > 1000:
-            self.status_label.config(text=f"Showing first 1,000 of {len(self.data):,} records")
-        elif len(display_columns) > 50:
+        # Update status if columns were truncated
+        if len(self.columns) > 50:
             self.status_label.config(text=f"Showing first 50 of {len(self.columns)} columns")
     
+    def render_visible_rows(self):
+        """Show the window of rows starting at self.top_row in the treeview"""
+        total = self.row_count
+        count = min(self.visible_rows, total)
+        self.top_row = max(0, min(self.top_row, total - count))
+        
+        # Convert and cap only the visible cells in one astype pass (None / NaN show as blank)
+        window = self.data.iloc[self.top_row:self.top_row + count].reindex(columns=self.display_columns)
+        cells = window.astype(str).where(window.notna(), '')
+        cells = cells.apply(lambda column: column.str[:100])
+        rows = list(cells.itertuples(index=False, name=None))
+        
+        # Tree items use their screen position as iid - reuse them and just swap values
+        rendered = len(self.tree.get_children())
+        for index, values in enumerate(rows):
+            if index < rendered:
+                self.tree.item(str(index), values=values)
+            else:
+                self.tree.insert('', 'end', iid=str(index), values=values)
+        if rendered > len(rows):
+            self.tree.delete(*[str(index) for index in range(len(rows), rendered)])
+        
+        if total:
+            self.v_scrollbar.set(self.top_row / total, (self.top_row + count) / total)
+    
+    def on_vertical_scroll(self, action, amount, unit=None):
+        """Scrollbar callback - move the visible window through the data"""
+        if not self.row_count:
+            return
+        
+        if action == 'moveto':
+            self.top_row = int(float(amount) * self.row_count)
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self.top_row += int(amount) * step
+        self.render_visible_rows()
+    
+    def on_mousewheel(self, event):
+        """Scroll three rows per wheel notch"""
+        if self.row_count:
+            direction = -1 if (event.num == 4 or event.delta > 0) else 1
+            self.top_row += direction * 3
+            self.render_visible_rows()
+        return 'break'  # Keep the treeview from scrolling its own items
+    
+    def on_tree_resize(self, event):
+        """Match the number of rendered rows to the treeview height"""
+        rows = max(1, (event.height - 25) // 25)  # Heading + 25px rows
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            if self.row_count:
+                self.render_visible_rows()
+    
     def export_csv(self):
         """Export the current data to CSV"""
         try:
-            # Check if data is empty - handle both DataFrame and list
-            data_is_empty = False
-            if self.data is None:
-                data_is_empty = True
-            elif hasattr(self.data, 'empty'):  # DataFrame
-                data_is_empty = self.data.empty
-            else:  # List or other iterable
-                data_is_empty = len(self.data) == 0
-                
-            if data_is_empty:
+            if not self.row_count:
                 messagebox.showwarning("No Data", "No data available to export.")
                 return
             
@@ -508,10 +616,16 @@ class ReportViewer:
             )
             
             if filename:
-                # Export using pandas for better formatting
-                import pandas as pd
-                df = pd.DataFrame(self.data)
-                df.to_csv(filename, index=False)
+                if self.records is not None:
+                    # Stream the source rows directly, no pandas serialisation pass
+                    columns = list(self.data.columns)
+                    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+                        writer = csv.writer(csvfile)
+                        writer.writerow(columns)
+                        writer.writerows(map(make_row_projector(columns), self.records))
+                else:
+                    # Let pandas write the frame in chunks
+                    self.data.to_csv(filename, index=False, chunksize=50000)
                 
                 file_size = os.path.getsize(filename) / (1024 * 1024)  # Size in MB
                 self.status_label.config(text=f"✅ Exported to {filename} ({file_size:.2f} MB)")
@@ -565,9 +679,10 @@ class ReportViewer:
     def refresh_data(self):
         """Refresh the data display"""
         try:
-            # Clear existing data
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+            # Clear existing data in a single Tcl call
+            children = self.tree.get_children()
+            if children:
+                self.tree.delete(*children)
             
             # Repopulate with current data
             display_columns = self.columns[:50] if len(self.columns) > 50 else self.columns
@@ -581,12 +696,86 @@ class ReportViewer:
 class ParameterDialog:
     """Dialog for collecting report parameters"""
     
+    # Map report types to their appropriate policy endpoints (first keyword found wins)
+    POLICY_ENDPOINT_KEYWORDS = (
+        # Windows Update Policies
+        ('qualityupdate', '/deviceManagement/windowsQualityUpdateProfiles'),
+        ('featureupdate', '/deviceManagement/windowsFeatureUpdateProfiles'),
+        ('driverupdate', '/deviceManagement/windowsDriverUpdateProfiles'),
+        ('updatering', '/deviceManagement/windowsUpdateForBusinessConfigurations'),
+        
+        # Compliance Policies
+        ('compliance', '/deviceManagement/deviceCompliancePolicies'),
+        ('compliant', '/deviceManagement/deviceCompliancePolicies'),
+        ('noncompliant', '/deviceManagement/deviceCompliancePolicies'),
+        
+        # Configuration Policies
+        ('configuration', '/deviceManagement/deviceConfigurations'),
+        ('config', '/deviceManagement/deviceConfigurations'),
+        ('setting', '/deviceManagement/deviceConfigurations'),
+        
+        # Enrollment Policies
+        ('enrollment', '/deviceManagement/deviceEnrollmentConfigurations'),
+        
+        # App Protection Policies
+        ('appprotection', '/deviceAppManagement/managedAppPolicies'),
+        ('mam', '/deviceAppManagement/managedAppPolicies'),
+        
+        # Conditional Access
+        ('conditionalaccess', '/identity/conditionalAccess/policies'),
+        
+        # Endpoint Security
+        ('security', '/deviceManagement/intents'),
+        ('antivirus', '/deviceManagement/intents'),
+        ('firewall', '/deviceManagement/intents'),
+    )
+    # One lookahead per keyword, tried in table order - lastindex is the winning keyword
+    POLICY_KEYWORD_PATTERN = re.compile('|'.join(f'(?=.*?({re.escape(keyword)}))'
+                                                 for keyword, _ in POLICY_ENDPOINT_KEYWORDS))
+    
+    # Most entries handed to a combobox dropdown at once - search reaches the rest
+    MAX_COMBO_ITEMS = 200
+    
+    # Device selector texts that are never a real device value
+    DEVICE_PLACEHOLDER = "Type device name or paste from Intune portal..."
+    DEVICE_LOADING_TEXT = 'Loading devices...'
+    
+    # Shared options for the small selector buttons, one entry per button kind
+    BUTTON_STYLES = {
+        'action': {'font': ('Segoe UI', 8), 'bg': '#e1e1e1', 'fg': '#323130',
+                   'relief': 'flat', 'cursor': 'hand2'},
+        'primary': {'font': ('Segoe UI', 8), 'bg': '#0078d4', 'fg': 'white',
+                    'relief': 'flat', 'cursor': 'hand2'},
+        'danger': {'font': ('Segoe UI', 8), 'bg': '#d13438', 'fg': 'white',
+                   'relief': 'flat', 'cursor': 'hand2'},
+    }
+    
     def __init__(self, parent, report_name, parameter_config):
         self.parent = parent
         self.report_name = report_name
         self.parameter_config = parameter_config
         self.result = None
         self.parameters = {}
+        self.search_after_ids = {}  # Pending debounced search per selector
+        self.temp_status_label = None  # Created on the first paste status message
+        self.policy_name_to_id_mapping = {}  # Policy names from every policy selector -> IDs
+        
+        # Device list and search index (filled by the device selector)
+        self.device_id_mapping = {}  # Maps display name to device ID
+        self.device_search_data = []  # All devices for search
+        # Search index, parallel to device_search_data (case-folded once per load)
+        self.device_names_folded = []
+        self.device_users_folded = []
+        self.device_display_names = []
+        self.device_trigram_index = {}  # 3-char substring -> device positions
+        self.device_name_positions = {}  # Case-folded device name -> first device position
+        self.device_combo_values = []  # Default (unsearched) dropdown entries
+        self.device_lookup_cache = {}  # Case-folded name lookup -> device position (or None)
+        
+        # Policy endpoint/type only depend on report_name - worked out once per dialog
+        self.cached_policy_endpoint = None
+        self.cached_policy_type_name = None
+        self.cached_policy_placeholder = None
         
         self.dialog = tk.Toplevel(parent.root)
         self.dialog.title(f"Configure Parameters - {report_name}")
@@ -604,16 +793,28 @@ class ParameterDialog:
         # Wait for dialog to close
         self.dialog.wait_window()
     
+    def schedule_search(self, key, search_callback, delay_ms=150):
+        """Debounce a search - only run it once typing pauses for delay_ms"""
+        pending = self.search_after_ids.get(key)
+        if pending:
+            self.dialog.after_cancel(pending)
+        
+        def run_search():
+            self.search_after_ids.pop(key, None)
+            if self.dialog.winfo_exists():
+                search_callback()
+        
+        self.search_after_ids[key] = self.dialog.after(delay_ms, run_search)
+    
+    def make_button(self, parent, text, command, kind='action', **options):
+        """Create a selector button using one of the shared BUTTON_STYLES"""
+        return tk.Button(parent, text=text, command=command,
+                         **self.BUTTON_STYLES[kind], **options)
+    
     def has_date_parameters(self):
         """Check if this report has date parameters"""
-        if 'parameters' not in self.parameter_config:
-            return False
-        
-        for param_name, param_config in self.parameter_config['parameters'].items():
-            if param_config.get('type') == 'date':
-                return True
-        
-        return False
+        return any(param_config.get('type') == 'date'
+                   for param_config in self.parameter_config.get('parameters', {}).values())
     
     def create_dialog_ui(self):
         """Create the parameter dialog UI"""
@@ -660,7 +861,7 @@ class ParameterDialog:
         desc_label.pack(anchor='w', pady=(0, 20))
         
         # Parameters section
-        if 'parameters' in self.parameter_config:
+        if self.parameter_config.get('parameters'):
             self.create_parameter_widgets(content_frame)
         
         # Quick templates section - only for reports with date parameters
@@ -703,6 +904,7 @@ class ParameterDialog:
         for param_name, param_config in self.parameter_config['parameters'].items():
             param_frame = tk.Frame(params_frame, bg='#f5f5f5')
             param_frame.pack(fill='x', padx=10, pady=10)
+            param_type = param_config.get('type', 'text')
             
             # Parameter label
             label_text = param_config.get('description', param_name)
@@ -715,7 +917,7 @@ class ParameterDialog:
             param_label.pack(anchor='w')
             
             # Add helpful hint for device selector
-            if param_config.get('type') == 'device_selector':
+            if param_type == 'device_selector':
                 hint_label = tk.Label(param_frame, 
                                      text="💡 Tip: Type to search, paste device name from Intune portal, or select from dropdown",
                                      font=('Segoe UI', 8, 'italic'),
@@ -723,8 +925,6 @@ class ParameterDialog:
                 hint_label.pack(anchor='w', pady=(2, 5))
             
             # Parameter widget based on type
-            param_type = param_config.get('type', 'text')
-            
             if param_type == 'device_selector':
                 widget = self.create_device_selector(param_frame, param_name)
             elif param_type == 'policy_selector':
@@ -745,10 +945,8 @@ class ParameterDialog:
         container = tk.Frame(parent, bg='#f5f5f5')
         container.pack(fill='x', pady=(5, 0))
         
-        # Device variable and mapping
+        # Device variable
         device_var = tk.StringVar()
-        self.device_id_mapping = {}  # Maps display name to device ID
-        self.device_search_data = []  # All devices for search
         
         # Create searchable combobox (editable for search and paste)
         device_combo = ttk.Combobox(container, textvariable=device_var, 
@@ -756,34 +954,41 @@ class ParameterDialog:
         device_combo.pack(side='left', padx=(0, 5))
         
         # Add placeholder text
-        device_combo.insert(0, "Type device name or paste from Intune portal...")
+        device_combo.insert(0, self.DEVICE_PLACEHOLDER)
+        device_var.placeholder = self.DEVICE_PLACEHOLDER  # Placeholder currently shown
+        device_var.selected_device_id = None
         device_combo.bind('<FocusIn>', lambda e: self.on_device_focus(device_combo, device_var))
-        device_combo.bind('<KeyRelease>', lambda e: self.on_device_search(device_combo, device_var, e))
+        device_combo.bind('<KeyRelease>', lambda e: self.schedule_search(
+            'device', lambda: self.on_device_search(device_combo, device_var, e)))
         device_combo.bind('<<ComboboxSelected>>', lambda e: self.on_device_selected(device_combo, device_var))
         
-        # Refresh button
-        refresh_btn = tk.Button(container, text="🔄", 
-                               command=lambda: self.load_devices(device_combo, device_var),
-                               font=('Segoe UI', 8),
-                               bg='#e1e1e1', fg='#323130',
-                               width=3, relief='flat', cursor='hand2')
-        refresh_btn.pack(side='left', padx=(2, 5))
-        
-        # Paste button
-        paste_btn = tk.Button(container, text="📋", 
-                             command=lambda: self.paste_device_name(device_combo, device_var),
-                             font=('Segoe UI', 8),
-                             bg='#0078d4', fg='white',
-                             width=3, relief='flat', cursor='hand2')
-        paste_btn.pack(side='left', padx=(0, 5))
+        # Buttons are built after the dialog first paints, or sooner if the selector gets focus
+        container.buttons_built = False
+        
+        def build_buttons(event=None):
+            if container.buttons_built or not container.winfo_exists():
+                return
+            container.buttons_built = True
+            
+            # Refresh button
+            refresh_btn = self.make_button(container, "🔄",
+                                           lambda: self.load_devices(device_combo, device_var), width=3)
+            refresh_btn.pack(side='left', padx=(2, 5))
+            
+            # Paste button
+            paste_btn = self.make_button(container, "📋",
+                                         lambda: self.paste_device_name(device_combo, device_var),
+                                         kind='primary', width=3)
+            paste_btn.pack(side='left', padx=(0, 5))
+            
+            # Clear button
+            clear_btn = self.make_button(container, "✖",
+                                         lambda: self.clear_device_selection(device_combo, device_var),
+                                         kind='danger', width=3)
+            clear_btn.pack(side='left')
         
-        # Clear button
-        clear_btn = tk.Button(container, text="✖", 
-                             command=lambda: self.clear_device_selection(device_combo, device_var),
-                             font=('Segoe UI', 8),
-                             bg='#d13438', fg='white',
-                             width=3, relief='flat', cursor='hand2')
-        clear_btn.pack(side='left')
+        device_combo.bind('<FocusIn>', build_buttons, add='+')
+        self.dialog.after_idle(build_buttons)
         
         # Store references for later use
         device_var.combo_widget = device_combo
@@ -808,8 +1013,7 @@ class ParameterDialog:
         search_entry.pack(side='left', padx=(0, 5))
         
         # Add context-aware placeholder text
-        policy_type = self.get_policy_type_name().lower()
-        placeholder_text = f"Search {policy_type}..."
+        placeholder_text = self.get_policy_search_placeholder()
         search_entry.insert(0, placeholder_text)
         search_entry.config(fg='gray')
         
@@ -826,25 +1030,16 @@ class ParameterDialog:
         search_entry.bind('<FocusIn>', on_focus_in)
         search_entry.bind('<FocusOut>', on_focus_out)
         
-        paste_btn = tk.Button(search_frame, text="📋", 
-                             command=lambda: self.paste_policy_name(search_var),
-                             font=('Segoe UI', 8),
-                             bg='#e1e1e1', fg='#323130',
-                             width=3, relief='flat', cursor='hand2')
+        paste_btn = self.make_button(search_frame, "📋",
+                                     lambda: self.paste_policy_name(search_var), width=3)
         paste_btn.pack(side='left', padx=(0, 5))
         
-        clear_btn = tk.Button(search_frame, text="✕", 
-                             command=lambda: self.clear_policy_search(search_var, policy_combo),
-                             font=('Segoe UI', 8),
-                             bg='#e1e1e1', fg='#323130',
-                             width=3, relief='flat', cursor='hand2')
+        clear_btn = self.make_button(search_frame, "✕",
+                                     lambda: self.clear_policy_search(search_var, policy_combo), width=3)
         clear_btn.pack(side='left', padx=(0, 5))
         
-        refresh_btn = tk.Button(search_frame, text="🔄", 
-                               command=lambda: self.load_policies(policy_combo, policy_var),
-                               font=('Segoe UI', 8),
-                               bg='#e1e1e1', fg='#323130',
-                               width=3, relief='flat', cursor='hand2')
+        refresh_btn = self.make_button(search_frame, "🔄",
+                                       lambda: self.load_policies(policy_combo, policy_var), width=3)
         refresh_btn.pack(side='left')
         
         # Bottom row: Policy dropdown
@@ -856,11 +1051,16 @@ class ParameterDialog:
         policy_combo.pack(fill='x', pady=(0, 0))
         
         # Bind search functionality
-        search_var.trace('w', lambda *args: self.filter_policies(search_var.get(), policy_combo, policy_var))
+        search_var.trace('w', lambda *args: self.schedule_search(
+            'policy', lambda: self.filter_policies(search_var.get(), policy_combo, policy_var)))
         
         # Store references for filtering
         policy_combo.all_policies = []
+        policy_combo.all_policies_folded = []
+        policy_combo.policy_mapping = {}
+        policy_combo.policy_source = None
         policy_combo.search_var = search_var
+        policy_combo.placeholder = placeholder_text
         
         self.parent.root.after(100, lambda: self.load_policies(policy_combo, policy_var))
         
@@ -877,7 +1077,6 @@ class ParameterDialog:
         date_entry.pack(side='left', padx=(0, 10))
         
         # Set default date based on parameter name
-        from datetime import datetime, timedelta
         if 'start' in param_name.lower():
             default_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
         else:
@@ -886,22 +1085,16 @@ class ParameterDialog:
         date_var.set(default_date)
         
         # Quick buttons
-        today_btn = tk.Button(container, text="Today", 
-                             command=lambda: date_var.set(datetime.now().strftime("%Y-%m-%d")),
-                             font=('Segoe UI', 8),
-                             bg='#e1e1e1', fg='#323130', relief='flat', cursor='hand2')
+        today_btn = self.make_button(container, "Today",
+                                     lambda: date_var.set(datetime.now().strftime("%Y-%m-%d")))
         today_btn.pack(side='left', padx=(0, 5))
         
-        week_btn = tk.Button(container, text="7 Days Ago", 
-                            command=lambda: date_var.set((datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")),
-                            font=('Segoe UI', 8),
-                            bg='#e1e1e1', fg='#323130', relief='flat', cursor='hand2')
+        week_btn = self.make_button(container, "7 Days Ago",
+                                    lambda: date_var.set((datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")))
         week_btn.pack(side='left', padx=(0, 5))
         
-        month_btn = tk.Button(container, text="30 Days Ago", 
-                             command=lambda: date_var.set((datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")),
-                             font=('Segoe UI', 8),
-                             bg='#e1e1e1', fg='#323130', relief='flat', cursor='hand2')
+        month_btn = self.make_button(container, "30 Days Ago",
+                                     lambda: date_var.set((datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")))
         month_btn.pack(side='left')
         
         return date_var
@@ -952,121 +1145,287 @@ class ParameterDialog:
     
     def apply_template(self, template_params):
         """Apply a parameter template"""
-        from datetime import datetime, timedelta
+        # Resolve every template keyword against a single "now"
+        now = datetime.now()
+        template_dates = {
+            "today": now.strftime("%Y-%m-%d"),
+            "7_days_ago": (now - timedelta(days=7)).strftime("%Y-%m-%d"),
+            "30_days_ago": (now - timedelta(days=30)).strftime("%Y-%m-%d"),
+            "month_start": now.replace(day=1).strftime("%Y-%m-%d")
+        }
         
         for param_name, param_value in template_params.items():
-            if param_name in self.param_widgets:
-                widget = self.param_widgets[param_name]
-                
-                if param_value == "today":
-                    widget.set(datetime.now().strftime("%Y-%m-%d"))
-                elif param_value == "7_days_ago":
-                    widget.set((datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d"))
-                elif param_value == "30_days_ago":
-                    widget.set((datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"))
-                elif param_value == "month_start":
-                    widget.set(datetime.now().replace(day=1).strftime("%Y-%m-%d"))
+            if param_name in self.param_widgets and param_value in template_dates:
+                self.param_widgets[param_name].set(template_dates[param_value])
     
     def load_devices(self, combo_widget, var_widget):
         """Load devices from Microsoft Graph with enhanced display"""
-        try:
-            if not self.parent.access_token:
-                combo_widget['values'] = ['Please login first']
-                return
+        if not self.parent.access_token:
+            combo_widget['values'] = ['Please login first']
+            return
+        
+        # Show the cached device list straight away, then revalidate it against Graph
+        cached_etag, cached_devices = self.parent.load_list_cache('devices')
+        if cached_devices is not None:
+            self.show_devices(cached_devices, combo_widget, var_widget)
+        else:
+            combo_widget['values'] = [self.DEVICE_LOADING_TEXT]
+            var_widget.set(self.DEVICE_LOADING_TEXT)
+        
+        # Make API call to get devices with more details
+        url = f"{self.parent.graph_base_url}/deviceManagement/managedDevices"
+        params = {
+            '$select': 'id,deviceName,userPrincipalName,model,manufacturer,operatingSystem,lastSyncDateTime,complianceState',
+            '$top': 999  # Page size, remaining pages follow @odata.nextLink
+        }
+        
+        # Fetch on the worker pool (in parallel with the policy list), fill the combo on the Tk thread
+        future = self.parent.executor.submit(self.fetch_graph_list, url, params, 'devices',
+                                             cached_etag, cached_devices)
+        future.add_done_callback(
+            lambda f: self.parent.root.after(0, lambda: self.on_devices_loaded(f, combo_widget, var_widget)))
+    
+    def fetch_graph_list(self, url, params, cache_name, cached_etag=None, cached_items=None):
+        """Download every page of a Graph list and refresh its disk cache (runs on the worker pool)"""
+        items = []
+        etag = None
+        complete = True
+        # Only the first page is conditional - a 304 means the cached copy is still current
+        headers = {'If-None-Match': cached_etag} if cached_etag else {}
+        
+        while url:
+            response = self.parent.make_authenticated_request('GET', url, params=params, headers=headers)
+            if response is not None and response.status_code == 304:
+                return cached_items
+            if not response or response.status_code != 200:
+                if items:
+                    self.parent.log_message(f"⚠️ {cache_name} list incomplete - stopped after {len(items)} items", 'warning')
+                    complete = False
+                    break
+                return None
             
-            combo_widget['values'] = ['Loading devices...']
-            var_widget.set('Loading devices...')
+            if not items:
+                etag = response.headers.get('ETag')
+            data = response.json()
+            items.extend(data.get('value', []))
             
-            # Make API call to get devices with more details
-            url = f"{self.parent.graph_base_url}/deviceManagement/managedDevices"
-            params = {
-                '$select': 'id,deviceName,userPrincipalName,model,manufacturer,operatingSystem,lastSyncDateTime,complianceState',
-                '$top': 1000  # Increased limit
-            }
+            # nextLink already carries the query string
+            url = data.get('@odata.nextLink')
+            params = None
+            headers = {}
+        
+        if complete:
+            self.parent.save_list_cache(cache_name, items, etag)
+        return items
+    
+    def on_devices_loaded(self, future, combo_widget, var_widget):
+        """Fill the device selector once the device list download finishes"""
+        if not combo_widget.winfo_exists():
+            return  # Dialog closed while loading
+        
+        try:
+            devices = future.result()
             
-            response = self.parent.make_authenticated_request('GET', url, params=params)
+            if devices is not None and devices is self.device_search_data:
+                return  # Cached list shown already is still current
             
-            if response and response.status_code == 200:
-                data = response.json()
-                devices = data.get('value', [])
-                
-                # Store raw device data for search
-                self.device_search_data = devices
-                
-                # Clear previous mappings
-                self.device_id_mapping = {}
-                
-                device_display_list = []
-                for device in devices:
-                    device_name = device.get('deviceName', 'Unknown')
-                    user_name = device.get('userPrincipalName', 'No User')
-                    device_id = device.get('id', '')
-                    
-                    # Create user-friendly display name (just device and user)
-                    display_name = f"{device_name} ({user_name})"
-                    
-                    # Map display name to device ID
-                    self.device_id_mapping[display_name] = device_id
-                    device_display_list.append(display_name)
-                
-                if device_display_list:
-                    # Sort alphabetically
-                    device_display_list.sort()
-                    combo_widget['values'] = device_display_list
-                    var_widget.set('')  # Clear loading text
-                    
-                    # Update placeholder
-                    if hasattr(combo_widget, 'set'):
-                        placeholder = f"Search {len(device_display_list)} devices or paste device name..."
-                        combo_widget.delete(0, 'end')
-                        combo_widget.insert(0, placeholder)
-                else:
-                    combo_widget['values'] = ['No devices found in tenant']
-                    var_widget.set('')
+            if devices is not None:
+                self.show_devices(devices, combo_widget, var_widget)
+            elif self.device_search_data:
+                self.parent.log_message("⚠️ Could not refresh device list - using cached devices", 'warning')
             else:
                 combo_widget['values'] = ['Failed to load devices - check permissions']
                 var_widget.set('')
                 
         except Exception as e:
-            combo_widget['values'] = [f'Error: {str(e)}']
-            var_widget.set('')
+            if not self.device_search_data:
+                combo_widget['values'] = [f'Error: {str(e)}']
+                var_widget.set('')
+    
+    def show_devices(self, devices, combo_widget, var_widget):
+        """Index a device list and show it in the device selector"""
+        # Sort the raw devices once (in place) so the display list and index come out ordered
+        devices.sort(key=lambda device: ((device.get('deviceName') or '').casefold(),
+                                         (device.get('userPrincipalName') or '').casefold()))
+        
+        # Store raw device data for search
+        self.device_search_data = devices
+        
+        # Clear previous mappings and search index
+        self.device_id_mapping = {}
+        self.device_names_folded = []
+        self.device_users_folded = []
+        self.device_display_names = []
+        self.device_trigram_index = {}
+        self.device_name_positions = {}
+        self.device_lookup_cache = {}
+        
+        device_display_list = []
+        for device in devices:
+            device_name = device.get('deviceName', 'Unknown')
+            user_name = device.get('userPrincipalName', 'No User')
+            device_id = device.get('id', '')
+            
+            # Create user-friendly display name (just device and user)
+            display_name = f"{device_name} ({user_name})"
+            
+            # Map display name to device ID
+            self.device_id_mapping[display_name] = device_id
+            device_display_list.append(display_name)
+            
+            # Index case-folded fields so searching doesn't redo this per keystroke
+            # (names are interned - they key the exact-match and lookup dicts)
+            self.device_names_folded.append(sys.intern((device.get('deviceName') or '').casefold()))
+            self.device_users_folded.append((device.get('userPrincipalName') or '').casefold())
+            self.device_display_names.append(display_name)
+            
+            # Trigram postings narrow longer searches to a few candidate devices
+            position = len(self.device_display_names) - 1
+            self.device_name_positions.setdefault(self.device_names_folded[-1], position)
+            searchable = f"{self.device_names_folded[-1]} {self.device_users_folded[-1]}"
+            for trigram in {searchable[i:i + 3] for i in range(len(searchable) - 2)}:
+                self.device_trigram_index.setdefault(trigram, []).append(position)
+        
+        # Leave the text alone if the user already typed or picked a device
+        current_text = var_widget.get()
+        showing_placeholder = current_text in ('', self.DEVICE_LOADING_TEXT, var_widget.placeholder)
+        
+        if device_display_list:
+            # Already alphabetical, only the first MAX_COMBO_ITEMS go in the dropdown
+            self.device_combo_values = device_display_list[:self.MAX_COMBO_ITEMS]
+            combo_widget['values'] = self.device_combo_values
+            
+            # Update placeholder
+            if showing_placeholder and hasattr(combo_widget, 'set'):
+                var_widget.set('')  # Clear loading text
+                placeholder = f"Search {len(device_display_list)} devices or paste device name..."
+                combo_widget.delete(0, 'end')
+                combo_widget.insert(0, placeholder)
+                var_widget.placeholder = placeholder
+        else:
+            combo_widget['values'] = ['No devices found in tenant']
+            if showing_placeholder:
+                var_widget.set('')
     
     def on_device_focus(self, combo_widget, var_widget):
         """Handle focus event on device selector"""
         current_text = var_widget.get()
-        if current_text == "Type device name or paste from Intune portal...":
+        if current_text == self.DEVICE_PLACEHOLDER:
             var_widget.set("")
     
     def on_device_search(self, combo_widget, var_widget, event):
         """Handle real-time search in device selector"""
-        search_text = var_widget.get().lower()
+        search_text = var_widget.get().casefold()
         
         if len(search_text) < 2:  # Only search after 2 characters
             return
         
-        # Filter devices based on search text
-        filtered_devices = []
-        for device in self.device_search_data:
-            device_name = device.get('deviceName', '').lower()
-            user_name = device.get('userPrincipalName', '').lower()
-            
-            if (search_text in device_name or 
-                search_text in user_name):
-                display_name = f"{device.get('deviceName', 'Unknown')} ({device.get('userPrincipalName', 'No User')})"
-                filtered_devices.append(display_name)
+        # Confirm the full substring against the prebuilt case-folded index
+        matches = []
+        for index in self.find_device_candidates(search_text):
+            device_name = self.device_names_folded[index]
+            user_name = self.device_users_folded[index]
+            if search_text in device_name or search_text in user_name:
+                # Rank device name prefix first, then user prefix, then anywhere
+                score = 0 if device_name.startswith(search_text) else 1 if user_name.startswith(search_text) else 2
+                matches.append((score, self.device_display_names[index]))
+        
+        # Best 20 results
+        filtered_devices = [display_name for _, display_name in heapq.nsmallest(20, matches)]
+        
+        # Not in the loaded list (still loading, failed, or newly enrolled) - ask Graph directly
+        typed_text = var_widget.get().strip()
+        if (not filtered_devices and len(search_text) >= 3 and self.parent.access_token and
+                typed_text not in (self.DEVICE_PLACEHOLDER, var_widget.placeholder)):
+            self.search_devices_on_server(typed_text, combo_widget, var_widget)
+            return
         
         # Update dropdown values
         if filtered_devices:
-            combo_widget['values'] = filtered_devices[:20]  # Limit to 20 results
+            combo_widget['values'] = filtered_devices
         else:
             combo_widget['values'] = ['No matching devices found']
     
+    def find_device_candidates(self, search_folded):
+        """Positions of devices that may contain the search text, in list order"""
+        # Devices sharing every trigram of the search (all devices for shorter searches)
+        if len(search_folded) >= 3:
+            postings = sorted((self.device_trigram_index.get(search_folded[i:i + 3], [])
+                               for i in range(len(search_folded) - 2)), key=len)
+            return sorted(set(postings[0]).intersection(*postings[1:]))
+        return range(len(self.device_display_names))
+    
+    def find_device_position(self, search_folded):
+        """Position of the first device whose name equals, or else contains, the search text"""
+        search_folded = sys.intern(search_folded)
+        
+        # Same name resolved before (misses are remembered as None)
+        if search_folded in self.device_lookup_cache:
+            return self.device_lookup_cache[search_folded]
+        
+        position = self.match_device_position(search_folded)
+        self.device_lookup_cache[search_folded] = position
+        return position
+    
+    def match_device_position(self, search_folded):
+        """Look a case-folded device name up in the search index"""
+        # Try exact match first
+        position = self.device_name_positions.get(search_folded)
+        if position is not None:
+            return position
+        
+        # One pass over the trigram candidates - a name prefix wins over a match further in
+        device_names = self.device_names_folded
+        partial_position = None
+        for index in self.find_device_candidates(search_folded):
+            device_name = device_names[index]
+            if device_name.startswith(search_folded):
+                return index
+            if partial_position is None and search_folded in device_name:
+                partial_position = index
+        return partial_position
+    
+    def search_devices_on_server(self, search_text, combo_widget, var_widget):
+        """Look devices up with a server-side startswith $filter"""
+        quoted = search_text.replace("'", "''")  # OData string literal escaping
+        url = f"{self.parent.graph_base_url}/deviceManagement/managedDevices"
+        params = {
+            '$filter': f"startswith(deviceName,'{quoted}') or startswith(userPrincipalName,'{quoted}')",
+            '$select': 'id,deviceName,userPrincipalName',
+            '$top': 25
+        }
+        
+        combo_widget['values'] = ['Searching tenant...']
+        future = self.parent.executor.submit(self.parent.make_authenticated_request, 'GET', url, params=params)
+        future.add_done_callback(
+            lambda f: self.parent.root.after(0, lambda: self.on_server_search_done(f, search_text, combo_widget, var_widget)))
+    
+    def on_server_search_done(self, future, search_text, combo_widget, var_widget):
+        """Show server-side device search results"""
+        if not combo_widget.winfo_exists() or var_widget.get().strip() != search_text:
+            return  # Dialog closed or the user kept typing
+        
+        try:
+            response = future.result()
+            devices = response.json().get('value', []) if response and response.status_code == 200 else []
+        except Exception:
+            devices = []
+        
+        found_devices = []
+        for device in devices:
+            display_name = f"{device.get('deviceName', 'Unknown')} ({device.get('userPrincipalName', 'No User')})"
+            # Make server results selectable like loaded ones
+            self.device_id_mapping[display_name] = device.get('id', '')
+            found_devices.append(display_name)
+        
+        combo_widget['values'] = found_devices[:20] if found_devices else ['No matching devices found']
+    
     def on_device_selected(self, combo_widget, var_widget):
         """Handle device selection from dropdown"""
-        selected = var_widget.get()
-        if selected and selected in self.device_id_mapping:
+        device_id = self.device_id_mapping.get(var_widget.get())
+        if device_id is not None:
             # Store the selected device info
-            var_widget.selected_device_id = self.device_id_mapping[selected]
+            var_widget.selected_device_id = device_id
     
     def paste_device_name(self, combo_widget, var_widget):
         """Paste device name from clipboard and attempt to match"""
@@ -1077,19 +1436,9 @@ class ParameterDialog:
             if not clipboard_text:
                 return
             
-            # Try to find matching device
-            matched_device = None
-            for device in self.device_search_data:
-                device_name = device.get('deviceName', '')
-                
-                # Try exact match first
-                if clipboard_text.lower() == device_name.lower():
-                    matched_device = device
-                    break
-                # Try partial match
-                elif clipboard_text.lower() in device_name.lower():
-                    matched_device = device
-                    break
+            # Exact name first, then partial
+            position = self.find_device_position(clipboard_text.casefold())
+            matched_device = self.device_search_data[position] if position is not None else None
             
             if matched_device:
                 display_name = f"{matched_device.get('deviceName', 'Unknown')} ({matched_device.get('userPrincipalName', 'No User')})"
@@ -1110,14 +1459,14 @@ class ParameterDialog:
         """Clear device selection"""
         var_widget.set("")
         var_widget.selected_device_id = None
-        combo_widget['values'] = [device for device in self.device_id_mapping.keys()]
+        combo_widget['values'] = self.device_combo_values
     
     def show_paste_status(self, message):
         """Show temporary status message for paste operation"""
         # Find status label in dialog if it exists
         try:
-            status_label = getattr(self, 'temp_status_label', None)
-            if not status_label:
+            status_label = self.temp_status_label
+            if status_label is None:
                 # Create temporary status label
                 status_frame = tk.Frame(self.dialog, bg='#f5f5f5')
                 status_frame.pack(fill='x', padx=20)
@@ -1137,106 +1486,117 @@ class ParameterDialog:
     
     def load_policies(self, combo_widget, var_widget):
         """Load policies from Microsoft Graph based on report type"""
-        try:
-            if not self.parent.access_token:
-                combo_widget['values'] = ['Please login first']
-                return
-            
+        if not self.parent.access_token:
+            combo_widget['values'] = ['Please login first']
+            return
+        
+        # Check what policy type to load
+        policy_endpoint = self.get_policy_endpoint_for_report()
+        
+        # Show the cached policy list straight away, then revalidate it against Graph
+        cache_name = 'policies_' + policy_endpoint.strip('/').replace('/', '_')
+        cached_etag, cached_policies = self.parent.load_list_cache(cache_name)
+        combo_widget.policy_source = None  # Raw policy list currently shown
+        if cached_policies is not None:
+            self.show_policies(cached_policies, combo_widget, var_widget)
+        else:
             combo_widget['values'] = ['Loading...']
             var_widget.set('Loading...')
+        
+        # Make API call to get policies
+        url = f"{self.parent.graph_base_url}{policy_endpoint}"
+        params = {'$select': 'id,displayName', '$top': 100}
+        
+        # Fetch on the worker pool (in parallel with the device list), fill the combo on the Tk thread
+        future = self.parent.executor.submit(self.fetch_graph_list, url, params, cache_name,
+                                             cached_etag, cached_policies)
+        future.add_done_callback(
+            lambda f: self.parent.root.after(0, lambda: self.on_policies_loaded(f, combo_widget, var_widget)))
+    
+    def on_policies_loaded(self, future, combo_widget, var_widget):
+        """Fill the policy selector once the policy list download finishes"""
+        if not combo_widget.winfo_exists():
+            return  # Dialog closed while loading
+        
+        policy_type = self.get_policy_type_name()
+        try:
+            policies = future.result()
             
-            # Check what policy type to load
-            policy_endpoint = self.get_policy_endpoint_for_report()
-            
-            # Make API call to get policies
-            url = f"{self.parent.graph_base_url}{policy_endpoint}"
-            params = {'$select': 'id,displayName', '$top': 100}
-            
-            response = self.parent.make_authenticated_request('GET', url, params=params)
+            if policies is not None and policies is combo_widget.policy_source:
+                return  # Cached list shown already is still current
             
-            if response and response.status_code == 200:
-                data = response.json()
-                policies = data.get('value', [])
-                
-                policy_list = []
-                policy_mapping = {}  # Map policy names to IDs
-                policy_type = self.get_policy_type_name()
-                
-                for policy in policies:
-                    display_name = policy.get('displayName', 'Unnamed Policy')
-                    policy_id = policy.get('id')
-                    policy_list.append(display_name)
-                    policy_mapping[display_name] = policy_id
-                
-                if policy_list:
-                    combo_widget.all_policies = policy_list
-                    combo_widget.policy_mapping = policy_mapping  # Store name-to-ID mapping
-                    combo_widget['values'] = policy_list
-                    # Store mapping at dialog level for easy access during parameter collection
-                    if not hasattr(self, 'policy_name_to_id_mapping'):
-                        self.policy_name_to_id_mapping = {}
-                    self.policy_name_to_id_mapping.update(policy_mapping)
-                    var_widget.set('')
-                    self.log_policy_load_success(policy_type, len(policy_list))
-                else:
-                    combo_widget.all_policies = []
-                    combo_widget.policy_mapping = {}
-                    combo_widget['values'] = [f'No {policy_type.lower()} found']
-            else:
+            if policies is not None:
+                self.show_policies(policies, combo_widget, var_widget)
+                self.log_policy_load_success(policy_type, len(combo_widget.all_policies))
+            elif combo_widget.policy_source is None:
                 combo_widget['values'] = [f'Failed to load {policy_type.lower()}']
                 
         except Exception as e:
-            combo_widget['values'] = [f'Error loading policies: {str(e)}']
+            if combo_widget.policy_source is None:
+                combo_widget['values'] = [f'Error loading policies: {str(e)}']
+    
+    def show_policies(self, policies, combo_widget, var_widget):
+        """Show a policy list in the policy selector"""
+        combo_widget.policy_source = policies
+        policy_list = []
+        policy_mapping = {}  # Map policy names to IDs
+        policy_type = self.get_policy_type_name()
+        
+        for policy in policies:
+            display_name = policy.get('displayName', 'Unnamed Policy')
+            policy_id = policy.get('id')
+            policy_list.append(display_name)
+            policy_mapping[display_name] = policy_id
+        
+        if policy_list:
+            combo_widget.all_policies = policy_list
+            combo_widget.all_policies_folded = [policy.casefold() for policy in policy_list]
+            combo_widget.policy_mapping = policy_mapping  # Store name-to-ID mapping
+            combo_widget['values'] = policy_list[:self.MAX_COMBO_ITEMS]
+            # Store mapping at dialog level for easy access during parameter collection
+            self.policy_name_to_id_mapping.update(policy_mapping)
+            # Keep a policy the user already picked if it still exists
+            if var_widget.get() not in policy_mapping:
+                var_widget.set('')
+        else:
+            combo_widget.all_policies = []
+            combo_widget.all_policies_folded = []
+            combo_widget.policy_mapping = {}
+            combo_widget['values'] = [f'No {policy_type.lower()} found']
+            var_widget.set('')
     
     def get_policy_endpoint_for_report(self):
         """Get the appropriate policy endpoint based on the current report"""
+        if self.cached_policy_endpoint is None:
+            self.cached_policy_endpoint = self.find_policy_endpoint_for_report()
+        return self.cached_policy_endpoint
+    
+    def find_policy_endpoint_for_report(self):
+        """Match the report name against the known policy endpoints"""
         report_name = getattr(self, 'report_name', '')
         
-        # Map report types to their appropriate policy endpoints
-        policy_mappings = {
-            # Windows Update Policies
-            'qualityupdate': '/deviceManagement/windowsQualityUpdateProfiles',
-            'featureupdate': '/deviceManagement/windowsFeatureUpdateProfiles', 
-            'driverupdate': '/deviceManagement/windowsDriverUpdateProfiles',
-            'updatering': '/deviceManagement/windowsUpdateForBusinessConfigurations',
-            
-            # Compliance Policies  
-            'compliance': '/deviceManagement/deviceCompliancePolicies',
-            'compliant': '/deviceManagement/deviceCompliancePolicies',
-            'noncompliant': '/deviceManagement/deviceCompliancePolicies',
-            
-            # Configuration Policies
-            'configuration': '/deviceManagement/deviceConfigurations',
-            'config': '/deviceManagement/deviceConfigurations',
-            'setting': '/deviceManagement/deviceConfigurations',
-            
-            # Enrollment Policies
-            'enrollment': '/deviceManagement/deviceEnrollmentConfigurations',
-            
-            # App Protection Policies
-            'appprotection': '/deviceAppManagement/managedAppPolicies',
-            'mam': '/deviceAppManagement/managedAppPolicies',
-            
-            # Conditional Access
-            'conditionalaccess': '/identity/conditionalAccess/policies',
-            
-            # Endpoint Security
-            'security': '/deviceManagement/intents',
-            'antivirus': '/deviceManagement/intents',
-            'firewall': '/deviceManagement/intents',
-        }
-        
-        # Check report name against mappings
-        report_lower = report_name.lower()
-        for keyword, endpoint in policy_mappings.items():
-            if keyword in report_lower:
-                return endpoint
+        # Check report name against mappings in one regex pass
+        match = self.POLICY_KEYWORD_PATTERN.match(report_name.lower())
+        if match:
+            return self.POLICY_ENDPOINT_KEYWORDS[match.lastindex - 1][1]
                 
         # Default to compliance policies if no match found
         return '/deviceManagement/deviceCompliancePolicies'
     
     def get_policy_type_name(self):
         """Get user-friendly policy type name based on endpoint"""
+        if self.cached_policy_type_name is None:
+            self.cached_policy_type_name = self.find_policy_type_name()
+        return self.cached_policy_type_name
+    
+    def get_policy_search_placeholder(self):
+        """Get the placeholder text shown in the policy search box"""
+        if self.cached_policy_placeholder is None:
+            self.cached_policy_placeholder = f"Search {self.get_policy_type_name().lower()}..."
+        return self.cached_policy_placeholder
+    
+    def find_policy_type_name(self):
+        """Map the policy endpoint to a user-friendly type name"""
         endpoint = self.get_policy_endpoint_for_report()
         
         type_names = {
@@ -1274,29 +1634,28 @@ class ParameterDialog:
     def clear_policy_search(self, search_var, combo_widget):
         """Clear policy search"""
         search_var.set("")
-        if hasattr(combo_widget, 'all_policies'):
-            combo_widget['values'] = combo_widget.all_policies
+        if combo_widget.all_policies:
+            combo_widget['values'] = combo_widget.all_policies[:self.MAX_COMBO_ITEMS]
     
     def filter_policies(self, search_text, combo_widget, policy_var):
         """Filter policies based on search text"""
-        if not hasattr(combo_widget, 'all_policies'):
+        if not combo_widget.all_policies:
             return
         
-        # Ignore placeholder text (dynamic based on policy type)
-        policy_type = self.get_policy_type_name().lower()
-        placeholder_text = f"Search {policy_type}..."
-        if not search_text or search_text == placeholder_text:
-            combo_widget['values'] = combo_widget.all_policies
+        # Ignore placeholder text (dynamic based on policy type, stored at creation)
+        if not search_text or search_text == combo_widget.placeholder:
+            combo_widget['values'] = combo_widget.all_policies[:self.MAX_COMBO_ITEMS]
             return
         
-        search_lower = search_text.lower()
+        # Every space-separated term must appear (checked against names case-folded at load)
+        search_terms = search_text.casefold().split()
         filtered_policies = []
         
-        for policy in combo_widget.all_policies:
-            if search_lower in policy.lower():
+        for policy, policy_folded in zip(combo_widget.all_policies, combo_widget.all_policies_folded):
+            if all(term in policy_folded for term in search_terms):
                 filtered_policies.append(policy)
         
-        combo_widget['values'] = filtered_policies if filtered_policies else ['No policies match search']
+        combo_widget['values'] = filtered_policies[:self.MAX_COMBO_ITEMS] if filtered_policies else ['No policies match search']
         
         # Auto-select if only one match
         if len(filtered_policies) == 1 and filtered_policies[0] != 'No policies match search':
@@ -1305,10 +1664,7 @@ class ParameterDialog:
     def validate_parameters(self):
         """Validate all parameters"""
         
-        if 'parameters' not in self.parameter_config:
-            return True
-        
-        for param_name, param_config in self.parameter_config['parameters'].items():
+        for param_name, param_config in self.parameter_config.get('parameters', {}).items():
             if param_config.get('required', False):
                 widget = self.param_widgets.get(param_name)
                 if widget and not widget.get().strip():
@@ -1321,66 +1677,61 @@ class ParameterDialog:
     def collect_parameters(self):
         """Collect all parameter values"""
         
+        # Reports without input ("requirement_level": "none") have nothing to collect
+        parameter_configs = self.parameter_config.get('parameters')
+        if not parameter_configs:
+            return {}
+        
         parameters = {}
         
-        if 'parameters' in self.parameter_config:
-            for param_name, param_config in self.parameter_config['parameters'].items():
-                widget = self.param_widgets.get(param_name)
-                if widget:
-                    value = widget.get().strip()
-                    
-                    if value and value != "Type device name or paste from Intune portal..." and not value.startswith("Search "):
-                        # Special date formats
-                        if param_config.get('type') == 'device_selector':
-                            # Check if we have a selected device ID stored
-                            if hasattr(widget, 'selected_device_id') and widget.selected_device_id:
-                                parameters[param_name] = widget.selected_device_id
-                            elif value in self.device_id_mapping:
-                                # Use mapping to get device ID
-                                parameters[param_name] = self.device_id_mapping[value]
-                            else:
-                                # Try to find device by name search
-                                matched_device = self.find_device_by_name(value)
-                                if matched_device:
-                                    parameters[param_name] = matched_device.get('id')
-                                else:
-                                    # Keep the user-entered value (might be manually entered ID)
-                                    parameters[param_name] = value
-                        elif param_config.get('type') == 'policy_selector':
-                            # Get policy ID from policy name using the stored mapping
-                            if hasattr(self, 'policy_name_to_id_mapping') and value in self.policy_name_to_id_mapping:
-                                parameters[param_name] = self.policy_name_to_id_mapping[value]
-                            else:
-                                # Fallback: if it's still in old format, extract ID
-                                if '|' in value:
-                                    parameters[param_name] = value.split('|')[0]
-                                else:
-                                    parameters[param_name] = value
-                        else:
-                            parameters[param_name] = value
+        # Selector types whose display value maps to an ID - everything else is used as typed
+        resolvers = {
+            'device_selector': self.resolve_device_parameter,
+            'policy_selector': self.resolve_policy_parameter
+        }
+        
+        for param_name, param_config in parameter_configs.items():
+            widget = self.param_widgets.get(param_name)
+            if widget:
+                value = widget.get().strip()
+                
+                if value and value not in (self.DEVICE_PLACEHOLDER, getattr(widget, 'placeholder', None)):
+                    resolver = resolvers.get(param_config.get('type'))
+                    parameters[param_name] = resolver(widget, value) if resolver else value
         
         return parameters
     
+    def resolve_device_parameter(self, widget, value):
+        """Turn the device selector value into a device ID"""
+        # Check if we have a selected device ID stored
+        if widget.selected_device_id:
+            return widget.selected_device_id
+        # Use mapping to get device ID
+        device_id = self.device_id_mapping.get(value)
+        if device_id is not None:
+            return device_id
+        
+        # Try to find device by name search
+        matched_device = self.find_device_by_name(value)
+        if matched_device:
+            return matched_device.get('id')
+        # Keep the user-entered value (might be manually entered ID)
+        return value
+    
+    def resolve_policy_parameter(self, widget, value):
+        """Turn the policy selector value into a policy ID"""
+        # Get policy ID from policy name using the stored mapping
+        policy_id = self.policy_name_to_id_mapping.get(value)
+        if policy_id is not None:
+            return policy_id
+        # Fallback: if it's still in old "id|name" format, extract ID (whole value otherwise)
+        return value.split('|', 1)[0]
+    
     def find_device_by_name(self, search_name):
         """Find device by name from loaded device data"""
-        if not hasattr(self, 'device_search_data'):
-            return None
-            
-        search_lower = search_name.lower()
-        
-        # Try exact match first
-        for device in self.device_search_data:
-            device_name = device.get('deviceName', '').lower()
-            if search_lower == device_name:
-                return device
-        
-        # Try partial match
-        for device in self.device_search_data:
-            device_name = device.get('deviceName', '').lower()
-            if search_lower in device_name:
-                return device
-        
-        return None
+        # Exact name first, then partial - both through the search index
+        position = self.find_device_position(search_name.casefold())
+        return self.device_search_data[position] if position is not None else None
     
     def ok_dialog(self):
         """Handle OK button click"""
@@ -1396,7 +1747,538 @@ class ParameterDialog:
         self.result = 'cancel'
         self.dialog.destroy()
 
+# Available reports (all 179 Intune reports from official Microsoft list)
+AVAILABLE_REPORTS = {
+    # Security & Antivirus Reports
+    "ActiveMalware": "Active Malware Detections",
+    "DefenderAgents": "Microsoft Defender Agent Status", 
+    "Malware": "Detected Malware Reports",
+    "UnhealthyDefenderAgents": "Unhealthy Defender Endpoints",
+    "FirewallStatus": "MDM Firewall Status for Windows 10+",
+    "FirewallUnhealthyStatus": "Firewall Unhealthy Status",
+
+    # Apps & Application Management
+    "AllAppsList": "All Apps List",
+    "FilteredAppsList": "Filtered Apps List", 
+    "AppInstallStatusAggregate": "App Install Status Aggregate",
+    "AppInvAggregate": "Discovered Apps Aggregate",
+    "AppInvByDevice": "Discovered Apps by Device",
+    "AppInvRawData": "Discovered Apps Raw Data",
+    "CatalogAppsUpdateList": "Enterprise App Catalog Updates",
+    "DependentAppsInstallStatus": "Dependent Apps Install Status",
+    "DeviceInstallStatusByApp": "Device Install Status by App",
+    "DevicesByAppInv": "Devices by App Inventory",
+    "OrgAppsInstallStatus": "Org Apps Install Status",
+    "UserInstallStatusAggregateByApp": "User Install Status by App",
+
+    # Mobile Application Management (MAM)
+    "MAMAppConfigurationStatus": "MAM App Configuration Status",
+    "MAMAppConfigurationStatusScopedV2": "MAM App Config Status Scoped V2",
+    "MAMAppConfigurationStatusV2": "MAM App Configuration Status V2",
+    "MAMAppProtectionStatus": "MAM App Protection Status (iOS/Android)",
+    "MAMAppProtectionStatusScopedV2": "MAM App Protection Status Scoped V2",
+    "MAMAppProtectionStatusV2": "MAM App Protection Status V2",
+
+    # Device Management & Inventory
+    "Devices": "All Managed Devices",
+    "DevicesWithInventory": "Devices with Hardware Inventory",
+    "AllDeviceCertificates": "All Device Certificates",
+    "CertificatesByRAPolicy": "Certificates by Registration Authority Policy",
+    "TpmAttestationStatus": "TPM Attestation Status",
+    "MEMUpgradeReadinessOrgAsset": "MEM Upgrade Readiness Org Assets",
+
+    # Device Compliance
+    "DeviceCompliance": "Device Compliance Status",
+    "DeviceComplianceTrend": "Device Compliance Trend",
+    "DeviceNonCompliance": "Device Non-Compliance Report",
+    "DevicesWithoutCompliancePolicy": "Devices Without Compliance Policy",
+    "DevicesWithoutCompliancePolicyV3": "Devices Without Compliance Policy V3",
+    "NonCompliantDevicesByCompliancePolicy": "Non-Compliant Devices by Policy",
+    "NonCompliantDevicesByCompliancePolicyV3": "Non-Compliant Devices by Policy V3",
+    "NoncompliantDevicesAndSettings": "Non-Compliant Devices and Settings",
+    "NoncompliantDevicesAndSettingsV3": "Non-Compliant Devices and Settings V3",
+    "NoncompliantDevicesToBeRetired": "Non-Compliant Devices to be Retired",
+    "NonCompliantCompliancePoliciesAggregate": "Non-Compliant Policies Aggregate",
+    "NonCompliantCompliancePoliciesAggregateV3": "Non-Compliant Policies Aggregate V3",
+    "NonCompliantConfigurationPoliciesAggregateWithPF": "Non-Compliant Config Policies with PF",
+    "NonCompliantConfigurationPoliciesAggregateWithPFV3": "Non-Compliant Config Policies with PF V3",
+
+    # Configuration Policies
+    "ConfigurationPolicyAggregate": "Configuration Policy Aggregate",
+    "ConfigurationPolicyAggregateV3": "Configuration Policy Aggregate V3",
+    "ConfigurationPolicyDeviceAggregates": "Configuration Policy Device Aggregates",
+    "ConfigurationPolicyDeviceAggregatesV3": "Configuration Policy Device Aggregates V3",
+    "ConfigurationPolicyDeviceAggregatesWithPF": "Configuration Policy Device Aggregates with PF",
+    "ConfigurationPolicyDeviceAggregatesWithPFV3": "Configuration Policy Device Aggregates with PF V3",
+    "DeviceConfigurationPolicyStatuses": "Device Configuration Policy Status",
+    "DeviceConfigurationPolicyStatusesV3": "Device Configuration Policy Status V3",
+    "DeviceConfigurationPolicyStatusesWithPF": "Device Configuration Policy Status with PF",
+    "DeviceConfigurationPolicyStatusesWithPFV3": "Device Configuration Policy Status with PF V3",
+    "Policies": "All Device Policies",
+
+    # Device Assignment & Status Reports
+    "DeviceAssignmentStatusByConfigurationPolicy": "Device Assignment Status by Config Policy",
+    "DeviceAssignmentStatusByConfigurationPolicyForAC": "Device Assignment Status for App Control",
+    "DeviceAssignmentStatusByConfigurationPolicyForASR": "Device Assignment Status for ASR",
+    "DeviceAssignmentStatusByConfigurationPolicyForEDR": "Device Assignment Status for EDR",
+    "DeviceAssignmentStatusByConfigurationPolicyV3": "Device Assignment Status by Config Policy V3",
+    "DeviceStatusesByConfigurationProfile": "Device Status by Configuration Profile",
+    "DeviceStatusesByConfigurationProfileForAppControl": "Device Status by Config Profile for App Control",
+    "DeviceStatusesByConfigurationProfileForASR": "Device Status by Config Profile for ASR",
+    "DeviceStatusesByConfigurationProfileForEDR": "Device Status by Config Profile for EDR",
+    "DeviceStatusesByConfigurationProfileV3": "Device Status by Configuration Profile V3",
+    "DeviceStatusesByConfigurationProfileWithPF": "Device Status by Config Profile with PF",
+    "DeviceStatusesByConfigurationProfileWithPFV3": "Device Status by Config Profile with PF V3",
+    "DeviceStatusesByInventoryPolicyWithPF": "Device Status by Inventory Policy with PF",
+    "DeviceStatusesByInventoryPolicyWithPFV3": "Device Status by Inventory Policy with PF V3",
+
+    # Compliance Policy Reports
+    "DevicePoliciesComplianceReport": "Device Policies Compliance Report",
+    "DevicePoliciesComplianceReportV3": "Device Policies Compliance Report V3",
+    "DevicePolicySettingsComplianceReport": "Device Policy Settings Compliance Report",
+    "DevicePolicySettingsComplianceReportV3": "Device Policy Settings Compliance Report V3",
+    "DeviceStatusByCompliacePolicyReport": "Device Status by Compliance Policy Report",
+    "DeviceStatusByCompliacePolicyReportV3": "Device Status by Compliance Policy Report V3",
+    "DeviceStatusByCompliancePolicySettingReport": "Device Status by Compliance Policy Setting",
+    "DeviceStatusByCompliancePolicySettingReportV3": "Device Status by Compliance Policy Setting V3",
+    "DeviceStatusSummaryByCompliacePolicyReport": "Device Status Summary by Compliance Policy",
+    "DeviceStatusSummaryByCompliacePolicyReportV3": "Device Status Summary by Compliance Policy V3",
+    "DeviceStatusSummaryByCompliancePolicySettingsReport": "Device Status Summary by Compliance Policy Settings",
+    "DeviceStatusSummaryByCompliancePolicySettingsReportV3": "Device Status Summary by Compliance Policy Settings V3",
+    "DevicesStatusByPolicyPlatformComplianceReport": "Devices Status by Policy Platform Compliance",
+    "DevicesStatusByPolicyPlatformComplianceReportV3": "Devices Status by Policy Platform Compliance V3",
+    "DevicesStatusBySettingReport": "Devices Status by Setting Report",
+    "DevicesStatusBySettingReportV3": "Devices Status by Setting Report V3",
+    "PolicyComplianceAggReport": "Policy Compliance Aggregate Report",
+    "PolicyComplianceAggReportV3": "Policy Compliance Aggregate Report V3",
+    "PolicyNonComplianceAgg": "Policy Non-Compliance Aggregate",
+    "PolicyNonComplianceAggVer3": "Policy Non-Compliance Aggregate V3",
+    "PolicyNonComplianceNew": "Policy Non-Compliance New",
+    "PolicyNonComplianceNewV3": "Policy Non-Compliance New V3",
+    "SettingComplianceAggReport": "Setting Compliance Aggregate Report",
+    "SettingComplianceAggReportV3": "Setting Compliance Aggregate Report V3",
+
+    # Windows Updates
+    "FeatureUpdateDeviceState": "Feature Update Device State",
+    "FeatureUpdatePolicyFailuresAggregate": "Feature Update Policy Failures Aggregate",
+    "FeatureUpdatePolicyStatusSummary": "Feature Update Policy Status Summary",
+    "QualityUpdateDeviceErrorsByPolicy": "Quality Update Device Errors by Policy",
+    "QualityUpdateDeviceStatusByPolicy": "Quality Update Device Status by Policy",
+    "QualityUpdatePolicyStatusSummary": "Quality Update Policy Status Summary",
+    "WindowsUpdatePerPolicyPerDeviceStatus": "Windows Update per Policy per Device Status",
+    "DriverUpdatePolicyStatusSummary": "Driver Update Policy Status Summary",
+    "DeviceFailuresByFeatureUpdatePolicy": "Device Failures by Feature Update Policy",
+    "WindowsDeviceHealthAttestationReport": "Windows Device Health Attestation Report",
+
+    # Enrollment & Autopilot
+    "EnrollmentActivity": "Device Enrollment Activity",
+    "DeviceEnrollmentFailures": "Device Enrollment Failures",
+    "EnrollmentConfigurationPoliciesByDevice": "Enrollment Configuration Policies by Device",
+    "AutopilotV1DeploymentStatus": "Autopilot V1 Deployment Status",
+    "AutopilotV2DeploymentStatus": "Autopilot V2 Deployment Status",
+    "AutopilotV2DeploymentStatusDetailedAppInfo": "Autopilot V2 Deployment Status - App Info",
+    "AutopilotV2DeploymentStatusDetailedScriptInfo": "Autopilot V2 Deployment Status - Script Info",
+
+    # Endpoint Analytics - Device Performance
+    "EADevicePerformance": "Endpoint Analytics Device Performance",
+    "EADevicePerformanceV2": "Endpoint Analytics Device Performance V2",
+    "EADeviceModelPerformance": "Endpoint Analytics Device Model Performance",
+    "EADeviceModelPerformanceV2": "Endpoint Analytics Device Model Performance V2",
+    "EADeviceScoresV2": "Endpoint Analytics Device Scores V2",
+    "EAModelScoresV2": "Endpoint Analytics Model Scores V2",
+
+    # Endpoint Analytics - Application Performance
+    "EAAppPerformance": "Endpoint Analytics App Performance",
+    "EAOSVersionsPerformance": "Endpoint Analytics OS Versions Performance",
+
+    # Endpoint Analytics - Startup Performance
+    "EAStartupPerfDevicePerformance": "Endpoint Analytics Startup Performance - Device",
+    "EAStartupPerfDevicePerformanceV2": "Endpoint Analytics Startup Performance - Device V2",
+    "EAStartupPerfDeviceProcesses": "Endpoint Analytics Startup Performance - Device Processes",
+    "EAStartupPerfModelPerformance": "Endpoint Analytics Startup Performance - Model",
+    "EAStartupPerfModelPerformanceV2": "Endpoint Analytics Startup Performance - Model V2",
+
+    # Endpoint Analytics - Resource Performance
+    "EAResourcePerfAggByDevice": "Endpoint Analytics Resource Performance by Device",
+    "EAResourcePerfAggByModel": "Endpoint Analytics Resource Performance by Model",
+    "EAResourcePerfCpuSpikeProcess": "Endpoint Analytics Resource Performance - CPU Spikes",
+    "EAResourcePerfRamSpikeProcess": "Endpoint Analytics Resource Performance - RAM Spikes",
+    "ResourcePerformanceAggregateByDevice": "Resource Performance Aggregate by Device",
+    "ResourcePerformanceAggregateByModel": "Resource Performance Aggregate by Model",
+
+    # Endpoint Analytics - Battery Health
+    "BRBatteryByModel": "Battery Report by Model Performance",
+    "BRBatteryByOs": "Battery Report by OS Performance",
+    "BRDeviceBatteryAgg": "Battery Report Device Performance Aggregate",
+    "BREnergyUsage": "Battery Report Energy Usage",
+
+    # Endpoint Analytics - Work from Anywhere
+    "EAWFADeviceList": "Endpoint Analytics Work from Anywhere - Device List",
+    "EAWFAModelPerformance": "Endpoint Analytics Work from Anywhere - Model Performance",
+    "EAWFAPerDevicePerformance": "Endpoint Analytics Work from Anywhere - Per Device Performance",
+    "WorkFromAnywhereDeviceList": "Work from Anywhere Device List",
+
+    # Endpoint Analytics - Anomalies
+    "EAAnomalyAsset": "Endpoint Analytics Anomaly Assets",
+    "EAAnomalyAssetV2": "Endpoint Analytics Anomaly Assets V2",
+    "EAAnomalyDeviceAsset": "Endpoint Analytics Anomaly Device Assets",
+    "EAAnomalyDeviceAssetV2": "Endpoint Analytics Anomaly Device Assets V2",
+
+    # Scripts & Proactive Remediations
+    "DeviceRunStatesByScript": "Device Run States by Script",
+    "DeviceRunStatesByProactiveRemediation": "Device Run States by Proactive Remediation",
+    "PolicyRunStatesByProactiveRemediation": "Policy Run States by Proactive Remediation",
+
+    # Endpoint Privilege Management (EPM)
+    "EpmAggregationReportByApplication": "EPM Elevation Report by Application",
+    "EpmAggregationReportByApplicationV2": "EPM Elevation Report by Application V2",
+    "EpmAggregationReportByPublisher": "EPM Elevation Report by Publisher",
+    "EpmAggregationReportByPublisherV2": "EPM Elevation Report by Publisher V2",
+    "EpmAggregationReportByUser": "EPM Elevation Report by User",
+    "EpmAggregationReportByUserV2": "EPM Elevation Report by User V2",
+    "EpmAggregationReportByUserAppByMonth": "EPM Elevation Report by User App by Month",
+    "EpmDeniedReport": "EPM Denied Elevations Report",
+    "EpmElevationReportByUserAppByDayToReporting": "EPM Elevation Report by User App by Day",
+    "EpmElevationReportElevationEvent": "EPM Elevation Report - Elevation Events",
+    "EpmInsightsElevationTrend": "EPM Insights Elevation Trend",
+    "EpmInsightsMostFrequentElevations": "EPM Insights Most Frequent Elevations",
+    "EpmInsightsReport": "EPM Insights Report",
+
+    # Device Settings & Configuration
+    "DeviceIntentPerSettingStatus": "Device Intent per Setting Status",
+    "DeviceInventoryPolicyStatusesV3": "Device Inventory Policy Status V3",
+    "DeviceInventoryPolicyStatusesWithPF": "Device Inventory Policy Status with PF",
+    "InventoryPolicyDeviceAggregatesV3": "Inventory Policy Device Aggregates V3",
+    "InventoryPolicyDeviceAggregatesWithPF": "Inventory Policy Device Aggregates with PF",
+    "PerSettingDeviceSummaryByConfigurationPolicy": "Per Setting Device Summary by Configuration Policy",
+    "PerSettingDeviceSummaryByConfigurationPolicyForAppControl": "Per Setting Device Summary for App Control",
+    "PerSettingDeviceSummaryByConfigurationPolicyForEDR": "Per Setting Device Summary for EDR",
+    "PerSettingDeviceSummaryByInventoryPolicy": "Per Setting Device Summary by Inventory Policy",
+    "PerSettingDeviceSummaryByInventoryPolicyV3": "Per Setting Device Summary by Inventory Policy V3",
+    "PerSettingSummaryByDeviceConfigurationPolicy": "Per Setting Summary by Device Configuration Policy",
+    "ADMXSettingsByDeviceByPolicy": "ADMX Settings by Device by Policy",
+
+    # Co-management & Cloud Attached Devices
+    "ComanagedDeviceWorkloads": "Co-managed Device Workloads",
+    "ComanagementEligibilityTenantAttachedDevices": "Co-management Eligibility Tenant Attached Devices",
+
+    # Group Policy Analytics
+    "GPAnalyticsSettingMigrationReadiness": "Group Policy Analytics Migration Readiness",
+
+    # Security Tasks & Monitoring
+    "TicketingSecurityTaskAppsList": "Security Task Apps List",
+    "OrgDeviceInstallStatus": "Org Device Install Status",
+
+    # Users & Remote Assistance
+    "Users": "All Users",
+    "AllGroupsInMyOrg": "All Groups in My Organization",
+    "RemoteAssistanceSessions": "Remote Assistance Sessions",
+    "UserScaleTest": "User Scale Test Report"
+}
+
+# Parameter requirements for reports
+REPORT_PARAMETER_REQUIREMENTS = {
+    # Reports requiring mandatory input
+    "AppInvByDevice": {
+        "requirement_level": "mandatory",
+        "icon": "🔴",
+        "parameters": {
+            "deviceId": {"type": "device_selector", "required": True, "description": "Select target device"}
+        },
+        "description": "Requires specific device selection"
+    },
+    "DeviceRunStatesByProfiles": {
+        "requirement_level": "mandatory", 
+        "icon": "🔴",
+        "parameters": {
+            "deviceId": {"type": "device_selector", "required": True, "description": "Select target device"}
+        },
+        "description": "Requires device context"
+    },
+    "FeatureUpdatePolicyFailuresAggregate": {
+        "requirement_level": "mandatory",
+        "icon": "🔴", 
+        "parameters": {
+            "startDate": {"type": "date", "required": True, "description": "Start date for report"},
+            "endDate": {"type": "date", "required": True, "description": "End date for report"}
+        },
+        "description": "Requires date range"
+    },
+    "QualityUpdatePolicyFailuresAggregate": {
+        "requirement_level": "mandatory",
+        "icon": "🔴",
+        "parameters": {
+            "startDate": {"type": "date", "required": True, "description": "Start date for report"},
+            "endDate": {"type": "date", "required": True, "description": "End date for report"}
+        },
+        "description": "Requires date range"
+    },
+
+    # Reports with no parameters (changed from optional to none)
+    "Devices": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
+    "DevicesWithInventory": {"requirement_level": "none", "icon": "�", "description": "No input required"},
+    "PolicyNonCompliance": {"requirement_level": "none", "icon": "�", "description": "No input required"},
+
+    # Reports requiring no input (green)
+    "AllAppsList": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
+    "DefenderAgents": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
+    "Users": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
+    "AllGroupsInMyOrg": {"requirement_level": "none", "icon": "🟢", "description": "No input required"}
+}
+
+# Every requirement entry has the same shape - reports without input get an empty parameter set
+for report_requirement in REPORT_PARAMETER_REQUIREMENTS.values():
+    report_requirement.setdefault('parameters', {})
+
+# Known parameter requirements for specific reports ("auto_*" dates are resolved at export time)
+REPORT_PARAMETERS = {
+    # Windows Update Reports
+    "FeatureUpdateDeviceState": {
+        "required": {
+            "filter": "PolicyId ne null",
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        },
+        "optional": {"top": 1000}
+    },
+
+    "QualityUpdateDeviceStatusByPolicy": {
+        "required": {
+            "filter": "PolicyId ne null",
+            "startDate": "auto_7_days_ago", 
+            "endDate": "auto_today"
+        }
+    },
+
+    "WindowsUpdatePerPolicyPerDeviceStatus": {
+        "required": {
+            "filter": "PolicyId ne null",
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        }
+    },
+
+    # Enrollment & Autopilot Reports
+    "DeviceEnrollmentFailures": {
+        "required": {
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        },
+        "optional": {"filter": "FailureCategory ne null"}
+    },
+
+    "EnrollmentActivity": {
+        "required": {
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        }
+    },
+
+    "AutopilotV1DeploymentStatus": {
+        "required": {
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        }
+    },
+
+    "AutopilotV2DeploymentStatus": {
+        "required": {
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        }
+    },
+
+    # Compliance & Policy Reports
+    "DeviceStatusByCompliacePolicyReport": {
+        "required": {
+            "filter": "PolicyId ne null"
+        },
+        "optional": {
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        }
+    },
+
+    "DeviceStatusByCompliancePolicySettingReport": {
+        "required": {
+            "filter": "PolicyId ne null AND SettingName ne null"
+        }
+    },
+
+    # Endpoint Analytics Reports
+    "EADevicePerformance": {
+        "required": {
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        }
+    },
+
+    "EAStartupPerfDevicePerformance": {
+        "required": {
+            "startDate": "auto_30_days_ago",
+            "endDate": "auto_today"
+        }
+    }
+}
+
+# Body fields every export job request starts from (plus reportName)
+BASE_EXPORT_PARAMETERS = {"format": "csv", "localizationType": "LocalizedValuesAsAdditionalColumn"}
+
+# Days back from today for each auto_* date tag
+AUTO_DATE_OFFSETS = {"auto_today": 0, "auto_7_days_ago": 7, "auto_30_days_ago": 30}
+
+
+def compile_parameter_config(config):
+    """Split a report parameter config into fixed values and (key, days ago) date fields"""
+    fixed_params = {}
+    date_params = []
+    for key, value in config.get("required", {}).items():
+        if value in AUTO_DATE_OFFSETS:
+            date_params.append((key, AUTO_DATE_OFFSETS[value]))
+        else:
+            fixed_params[key] = value
+    fixed_params.update(config.get("optional", {}))
+    return {"fixed": fixed_params, "dates": date_params}
+
+
+# REPORT_PARAMETERS with the auto_* tags classified once at import; dates are filled in per call
+COMPILED_REPORT_PARAMETERS = {report_name: compile_parameter_config(config)
+                              for report_name, config in REPORT_PARAMETERS.items()}
+
+# Reports that use direct GET API calls instead of export jobs
+DIRECT_API_REPORTS = {
+    "Users": {
+        "endpoint": "/users",
+        "base_url": "https://graph.microsoft.com/v1.0",
+        "required_permission": "User.ReadBasic.All",
+        "description": "Retrieves all users in the organization",
+        "parameters": {
+            "$top": 999
+        }
+    },
+
+    "AllGroupsInMyOrg": {
+        "endpoint": "/groups",
+        "base_url": "https://graph.microsoft.com/v1.0",
+        "required_permission": "Group.Read.All",
+        "description": "Retrieves all groups in the organization",
+        "parameters": {
+            "$top": 999
+        }
+    },
+
+    "OrgAppsInstallStatus": {
+        "endpoint": "/deviceAppManagement/mobileApps",
+        "base_url": "https://graph.microsoft.com/beta",
+        "required_permission": "DeviceManagementApps.Read.All",
+        "description": "Retrieves organization apps install status",
+        "parameters": {
+            "$top": 999,
+            "$filter": "isAssigned eq true"
+        }
+    },
+
+    "OrgDeviceInstallStatus": {
+        "endpoint": "/deviceAppManagement/mobileApps",
+        "base_url": "https://graph.microsoft.com/beta",
+        "required_permission": "DeviceManagementApps.Read.All",
+        "description": "Retrieves organization device install status for apps",
+        "parameters": {
+            "$top": 999,
+            "$expand": "installSummary,deviceStatuses,userStatuses"
+        }
+    },
+
+    "Devices": {
+        "endpoint": "/deviceManagement/managedDevices", 
+        "base_url": "https://graph.microsoft.com/beta",
+        "required_permission": "DeviceManagementManagedDevices.Read.All",
+        "description": "Retrieves all managed devices",
+        "parameters": {
+            "$top": 999
+        }
+    },
+
+    "AllAppsList": {
+        "endpoint": "/deviceAppManagement/mobileApps",
+        "base_url": "https://graph.microsoft.com/beta", 
+        "required_permission": "DeviceManagementApps.Read.All",
+        "description": "Retrieves all mobile applications",
+        "parameters": {
+            "$top": 999
+        }
+    },
+
+    "Policies": {
+        "endpoint": "/deviceManagement/deviceCompliancePolicies",
+        "base_url": "https://graph.microsoft.com/beta",
+        "required_permission": "DeviceManagementConfiguration.Read.All",
+        "description": "Retrieves all device compliance policies",
+        "parameters": {
+            "$top": 999,
+            "$expand": "deviceStatusOverview,userStatusOverview"
+        }
+    },
+
+    "DevicesByAppInv": {
+        "endpoint": "/deviceAppManagement/mobileApps",
+        "base_url": "https://graph.microsoft.com/beta",
+        "required_permission": "DeviceManagementApps.Read.All",
+        "description": "Retrieves devices by app inventory",
+        "parameters": {
+            "$top": 999
+        }
+    },
+
+    "AppInvByDevice": {
+        "endpoint": "/deviceAppManagement/mobileApps",
+        "base_url": "https://graph.microsoft.com/beta",
+        "required_permission": "DeviceManagementApps.Read.All",
+        "description": "Retrieves app inventory by device",
+        "parameters": {
+            "$top": 999
+        }
+    }
+}
+
+# Full request URL of each direct API report with its default query string (used when no filters are entered)
+DIRECT_API_URLS = {
+    name: f"{config['base_url']}{config['endpoint']}?{urllib.parse.urlencode(config['parameters'])}"
+    for name, config in DIRECT_API_REPORTS.items()
+}
+
+
 class IntuneReportsGUI:
+    # Report name keywords that pick the smart parameter defaults (matched on the lowercased name)
+    # One lookahead per kind, tried in priority order - lastgroup is the winning kind
+    SMART_DEFAULTS_PATTERN = re.compile('(?=.*?(?P<date>update|feature|quality|enrollment|autopilot))'
+                                        '|(?=.*?(?P<performance>performance|analytics|ea))'
+                                        '|(?=.*?(?P<policy>policy|compliance|setting))')
+    # App inventory / install status reports reject the PolicyId filter
+    # ("installstatus" also covers OrgDeviceInstallStatus and DeviceInstallStatus)
+    INSTALL_STATUS_REPORT_KEYWORDS = ('appinv', 'installstatus')
+    
+    # Learned-parameter instructions, kept as bit flags next to the learned API parameters
+    LEARNED_REMOVE_FILTER = 1
+    LEARNED_MINIMAL_PARAMS = 2
+    MAX_LEARNED_REPORTS = 128  # Learned-parameter entries kept, least recently used dropped first
+    
+    # Console log lines are collected and written at most once per this many milliseconds
+    LOG_FLUSH_DELAY_MS = 50
+    MAX_CONSOLE_LINES = 5000  # Oldest console lines are dropped beyond this (trimmed once 10% over)
+    
+    # Column search runs once typing pauses for this many milliseconds
+    COLUMN_FILTER_DELAY_MS = 120
+    COLUMN_RESIZE_DELAY_MS = 50  # Canvas width changes settle for this long before the rows are re-laid out
+    # Column name keywords picked by the "Common" button
+    COMMON_COLUMN_PATTERN = re.compile('name|id|user|device|status|state|date|time|'
+                                       'compliance|version|manufacturer|model|serial', re.IGNORECASE)
+    
+    # Column selection grid - fixed-height rows so only the rows in view need checkbox widgets
+    COLUMNS_PER_ROW = 2
+    COLUMN_ROW_HEIGHT = 36
+    COLUMN_OVERSCAN_ROWS = 2  # Extra rows rendered above and below the view
+    
     def __init__(self):
         # Configuration
         self.client_id = "enter the client id here"
@@ -1415,295 +2297,49 @@ class IntuneReportsGUI:
         self.user_info = None
         self.token_expires_at = None
         self.token_issued_at = None
+        self.token_cache_path = self.get_token_cache_path()
         
         # Enterprise features
         self.rate_limiter = RateLimiter()
         self.timeout_manager = TimeoutManager()
         
+        # Shared HTTP session - reuses keep-alive connections across Graph API calls
+        self.session = requests.Session()
+        graph_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount('https://graph.microsoft.com', graph_adapter)
+        self.session.mount('https://login.microsoftonline.com', graph_adapter)
+        # Export files come from signed blob storage URLs on other hosts - give them their own pool
+        download_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        self.session.mount('https://', download_adapter)
+        self.session.headers.update({'Accept': 'application/json'})
+        # Shared worker pool for independent Graph fetches (uses the same session)
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        # Serialises token refresh across the worker threads
+        self.token_refresh_lock = threading.Lock()
+        
         # Export data
         self.current_export_data = None
         self.current_columns = []
-        self.column_vars = {}
-        self.learned_parameters = {}  # Cache for learned report parameters
-        
-        # Available reports (all 179 Intune reports from official Microsoft list)
-        self.available_reports = {
-            # Security & Antivirus Reports
-            "ActiveMalware": "Active Malware Detections",
-            "DefenderAgents": "Microsoft Defender Agent Status", 
-            "Malware": "Detected Malware Reports",
-            "UnhealthyDefenderAgents": "Unhealthy Defender Endpoints",
-            "FirewallStatus": "MDM Firewall Status for Windows 10+",
-            "FirewallUnhealthyStatus": "Firewall Unhealthy Status",
-            
-            # Apps & Application Management
-            "AllAppsList": "All Apps List",
-            "FilteredAppsList": "Filtered Apps List", 
-            "AppInstallStatusAggregate": "App Install Status Aggregate",
-            "AppInvAggregate": "Discovered Apps Aggregate",
-            "AppInvByDevice": "Discovered Apps by Device",
-            "AppInvRawData": "Discovered Apps Raw Data",
-            "CatalogAppsUpdateList": "Enterprise App Catalog Updates",
-            "DependentAppsInstallStatus": "Dependent Apps Install Status",
-            "DeviceInstallStatusByApp": "Device Install Status by App",
-            "DevicesByAppInv": "Devices by App Inventory",
-            "OrgAppsInstallStatus": "Org Apps Install Status",
-            "UserInstallStatusAggregateByApp": "User Install Status by App",
-            
-            # Mobile Application Management (MAM)
-            "MAMAppConfigurationStatus": "MAM App Configuration Status",
-            "MAMAppConfigurationStatusScopedV2": "MAM App Config Status Scoped V2",
-            "MAMAppConfigurationStatusV2": "MAM App Configuration Status V2",
-            "MAMAppProtectionStatus": "MAM App Protection Status (iOS/Android)",
-            "MAMAppProtectionStatusScopedV2": "MAM App Protection Status Scoped V2",
-            "MAMAppProtectionStatusV2": "MAM App Protection Status V2",
-            
-            # Device Management & Inventory
-            "Devices": "All Managed Devices",
-            "DevicesWithInventory": "Devices with Hardware Inventory",
-            "AllDeviceCertificates": "All Device Certificates",
-            "CertificatesByRAPolicy": "Certificates by Registration Authority Policy",
-            "TpmAttestationStatus": "TPM Attestation Status",
-            "MEMUpgradeReadinessOrgAsset": "MEM Upgrade Readiness Org Assets",
-            
-            # Device Compliance
-            "DeviceCompliance": "Device Compliance Status",
-            "DeviceComplianceTrend": "Device Compliance Trend",
-            "DeviceNonCompliance": "Device Non-Compliance Report",
-            "DevicesWithoutCompliancePolicy": "Devices Without Compliance Policy",
-            "DevicesWithoutCompliancePolicyV3": "Devices Without Compliance Policy V3",
-            "NonCompliantDevicesByCompliancePolicy": "Non-Compliant Devices by Policy",
-            "NonCompliantDevicesByCompliancePolicyV3": "Non-Compliant Devices by Policy V3",
-            "NoncompliantDevicesAndSettings": "Non-Compliant Devices and Settings",
-            "NoncompliantDevicesAndSettingsV3": "Non-Compliant Devices and Settings V3",
-            "NoncompliantDevicesToBeRetired": "Non-Compliant Devices to be Retired",
-            "NonCompliantCompliancePoliciesAggregate": "Non-Compliant Policies Aggregate",
-            "NonCompliantCompliancePoliciesAggregateV3": "Non-Compliant Policies Aggregate V3",
-            "NonCompliantConfigurationPoliciesAggregateWithPF": "Non-Compliant Config Policies with PF",
-            "NonCompliantConfigurationPoliciesAggregateWithPFV3": "Non-Compliant Config Policies with PF V3",
-            
-            # Configuration Policies
-            "ConfigurationPolicyAggregate": "Configuration Policy Aggregate",
-            "ConfigurationPolicyAggregateV3": "Configuration Policy Aggregate V3",
-            "ConfigurationPolicyDeviceAggregates": "Configuration Policy Device Aggregates",
-            "ConfigurationPolicyDeviceAggregatesV3": "Configuration Policy Device Aggregates V3",
-            "ConfigurationPolicyDeviceAggregatesWithPF": "Configuration Policy Device Aggregates with PF",
-            "ConfigurationPolicyDeviceAggregatesWithPFV3": "Configuration Policy Device Aggregates with PF V3",
-            "DeviceConfigurationPolicyStatuses": "Device Configuration Policy Status",
-            "DeviceConfigurationPolicyStatusesV3": "Device Configuration Policy Status V3",
-            "DeviceConfigurationPolicyStatusesWithPF": "Device Configuration Policy Status with PF",
-            "DeviceConfigurationPolicyStatusesWithPFV3": "Device Configuration Policy Status with PF V3",
-            "Policies": "All Device Policies",
-            
-            # Device Assignment & Status Reports
-            "DeviceAssignmentStatusByConfigurationPolicy": "Device Assignment Status by Config Policy",
-            "DeviceAssignmentStatusByConfigurationPolicyForAC": "Device Assignment Status for App Control",
-            "DeviceAssignmentStatusByConfigurationPolicyForASR": "Device Assignment Status for ASR",
-            "DeviceAssignmentStatusByConfigurationPolicyForEDR": "Device Assignment Status for EDR",
-            "DeviceAssignmentStatusByConfigurationPolicyV3": "Device Assignment Status by Config Policy V3",
-            "DeviceStatusesByConfigurationProfile": "Device Status by Configuration Profile",
-            "DeviceStatusesByConfigurationProfileForAppControl": "Device Status by Config Profile for App Control",
-            "DeviceStatusesByConfigurationProfileForASR": "Device Status by Config Profile for ASR",
-            "DeviceStatusesByConfigurationProfileForEDR": "Device Status by Config Profile for EDR",
-            "DeviceStatusesByConfigurationProfileV3": "Device Status by Configuration Profile V3",
-            "DeviceStatusesByConfigurationProfileWithPF": "Device Status by Config Profile with PF",
-            "DeviceStatusesByConfigurationProfileWithPFV3": "Device Status by Config Profile with PF V3",
-            "DeviceStatusesByInventoryPolicyWithPF": "Device Status by Inventory Policy with PF",
-            "DeviceStatusesByInventoryPolicyWithPFV3": "Device Status by Inventory Policy with PF V3",
-            
-            # Compliance Policy Reports
-            "DevicePoliciesComplianceReport": "Device Policies Compliance Report",
-            "DevicePoliciesComplianceReportV3": "Device Policies Compliance Report V3",
-            "DevicePolicySettingsComplianceReport": "Device Policy Settings Compliance Report",
-            "DevicePolicySettingsComplianceReportV3": "Device Policy Settings Compliance Report V3",
-            "DeviceStatusByCompliacePolicyReport": "Device Status by Compliance Policy Report",
-            "DeviceStatusByCompliacePolicyReportV3": "Device Status by Compliance Policy Report V3",
-            "DeviceStatusByCompliancePolicySettingReport": "Device Status by Compliance Policy Setting",
-            "DeviceStatusByCompliancePolicySettingReportV3": "Device Status by Compliance Policy Setting V3",
-            "DeviceStatusSummaryByCompliacePolicyReport": "Device Status Summary by Compliance Policy",
-            "DeviceStatusSummaryByCompliacePolicyReportV3": "Device Status Summary by Compliance Policy V3",
-            "DeviceStatusSummaryByCompliancePolicySettingsReport": "Device Status Summary by Compliance Policy Settings",
-            "DeviceStatusSummaryByCompliancePolicySettingsReportV3": "Device Status Summary by Compliance Policy Settings V3",
-            "DevicesStatusByPolicyPlatformComplianceReport": "Devices Status by Policy Platform Compliance",
-            "DevicesStatusByPolicyPlatformComplianceReportV3": "Devices Status by Policy Platform Compliance V3",
-            "DevicesStatusBySettingReport": "Devices Status by Setting Report",
-            "DevicesStatusBySettingReportV3": "Devices Status by Setting Report V3",
-            "PolicyComplianceAggReport": "Policy Compliance Aggregate Report",
-            "PolicyComplianceAggReportV3": "Policy Compliance Aggregate Report V3",
-            "PolicyNonComplianceAgg": "Policy Non-Compliance Aggregate",
-            "PolicyNonComplianceAggVer3": "Policy Non-Compliance Aggregate V3",
-            "PolicyNonComplianceNew": "Policy Non-Compliance New",
-            "PolicyNonComplianceNewV3": "Policy Non-Compliance New V3",
-            "SettingComplianceAggReport": "Setting Compliance Aggregate Report",
-            "SettingComplianceAggReportV3": "Setting Compliance Aggregate Report V3",
-            
-            # Windows Updates
-            "FeatureUpdateDeviceState": "Feature Update Device State",
-            "FeatureUpdatePolicyFailuresAggregate": "Feature Update Policy Failures Aggregate",
-            "FeatureUpdatePolicyStatusSummary": "Feature Update Policy Status Summary",
-            "QualityUpdateDeviceErrorsByPolicy": "Quality Update Device Errors by Policy",
-            "QualityUpdateDeviceStatusByPolicy": "Quality Update Device Status by Policy",
-            "QualityUpdatePolicyStatusSummary": "Quality Update Policy Status Summary",
-            "WindowsUpdatePerPolicyPerDeviceStatus": "Windows Update per Policy per Device Status",
-            "DriverUpdatePolicyStatusSummary": "Driver Update Policy Status Summary",
-            "DeviceFailuresByFeatureUpdatePolicy": "Device Failures by Feature Update Policy",
-            "WindowsDeviceHealthAttestationReport": "Windows Device Health Attestation Report",
-            
-            # Enrollment & Autopilot
-            "EnrollmentActivity": "Device Enrollment Activity",
-            "DeviceEnrollmentFailures": "Device Enrollment Failures",
-            "EnrollmentConfigurationPoliciesByDevice": "Enrollment Configuration Policies by Device",
-            "AutopilotV1DeploymentStatus": "Autopilot V1 Deployment Status",
-            "AutopilotV2DeploymentStatus": "Autopilot V2 Deployment Status",
-            "AutopilotV2DeploymentStatusDetailedAppInfo": "Autopilot V2 Deployment Status - App Info",
-            "AutopilotV2DeploymentStatusDetailedScriptInfo": "Autopilot V2 Deployment Status - Script Info",
-            
-            # Endpoint Analytics - Device Performance
-            "EADevicePerformance": "Endpoint Analytics Device Performance",
-            "EADevicePerformanceV2": "Endpoint Analytics Device Performance V2",
-            "EADeviceModelPerformance": "Endpoint Analytics Device Model Performance",
-            "EADeviceModelPerformanceV2": "Endpoint Analytics Device Model Performance V2",
-            "EADeviceScoresV2": "Endpoint Analytics Device Scores V2",
-            "EAModelScoresV2": "Endpoint Analytics Model Scores V2",
-            
-            # Endpoint Analytics - Application Performance
-            "EAAppPerformance": "Endpoint Analytics App Performance",
-            "EAOSVersionsPerformance": "Endpoint Analytics OS Versions Performance",
-            
-            # Endpoint Analytics - Startup Performance
-            "EAStartupPerfDevicePerformance": "Endpoint Analytics Startup Performance - Device",
-            "EAStartupPerfDevicePerformanceV2": "Endpoint Analytics Startup Performance - Device V2",
-            "EAStartupPerfDeviceProcesses": "Endpoint Analytics Startup Performance - Device Processes",
-            "EAStartupPerfModelPerformance": "Endpoint Analytics Startup Performance - Model",
-            "EAStartupPerfModelPerformanceV2": "Endpoint Analytics Startup Performance - Model V2",
-            
-            # Endpoint Analytics - Resource Performance
-            "EAResourcePerfAggByDevice": "Endpoint Analytics Resource Performance by Device",
-            "EAResourcePerfAggByModel": "Endpoint Analytics Resource Performance by Model",
-            "EAResourcePerfCpuSpikeProcess": "Endpoint Analytics Resource Performance - CPU Spikes",
-            "EAResourcePerfRamSpikeProcess": "Endpoint Analytics Resource Performance - RAM Spikes",
-            "ResourcePerformanceAggregateByDevice": "Resource Performance Aggregate by Device",
-            "ResourcePerformanceAggregateByModel": "Resource Performance Aggregate by Model",
-            
-            # Endpoint Analytics - Battery Health
-            "BRBatteryByModel": "Battery Report by Model Performance",
-            "BRBatteryByOs": "Battery Report by OS Performance",
-            "BRDeviceBatteryAgg": "Battery Report Device Performance Aggregate",
-            "BREnergyUsage": "Battery Report Energy Usage",
-            
-            # Endpoint Analytics - Work from Anywhere
-            "EAWFADeviceList": "Endpoint Analytics Work from Anywhere - Device List",
-            "EAWFAModelPerformance": "Endpoint Analytics Work from Anywhere - Model Performance",
-            "EAWFAPerDevicePerformance": "Endpoint Analytics Work from Anywhere - Per Device Performance",
-            "WorkFromAnywhereDeviceList": "Work from Anywhere Device List",
-            
-            # Endpoint Analytics - Anomalies
-            "EAAnomalyAsset": "Endpoint Analytics Anomaly Assets",
-            "EAAnomalyAssetV2": "Endpoint Analytics Anomaly Assets V2",
-            "EAAnomalyDeviceAsset": "Endpoint Analytics Anomaly Device Assets",
-            "EAAnomalyDeviceAssetV2": "Endpoint Analytics Anomaly Device Assets V2",
-            
-            # Scripts & Proactive Remediations
-            "DeviceRunStatesByScript": "Device Run States by Script",
-            "DeviceRunStatesByProactiveRemediation": "Device Run States by Proactive Remediation",
-            "PolicyRunStatesByProactiveRemediation": "Policy Run States by Proactive Remediation",
-            
-            # Endpoint Privilege Management (EPM)
-            "EpmAggregationReportByApplication": "EPM Elevation Report by Application",
-            "EpmAggregationReportByApplicationV2": "EPM Elevation Report by Application V2",
-            "EpmAggregationReportByPublisher": "EPM Elevation Report by Publisher",
-            "EpmAggregationReportByPublisherV2": "EPM Elevation Report by Publisher V2",
-            "EpmAggregationReportByUser": "EPM Elevation Report by User",
-            "EpmAggregationReportByUserV2": "EPM Elevation Report by User V2",
-            "EpmAggregationReportByUserAppByMonth": "EPM Elevation Report by User App by Month",
-            "EpmDeniedReport": "EPM Denied Elevations Report",
-            "EpmElevationReportByUserAppByDayToReporting": "EPM Elevation Report by User App by Day",
-            "EpmElevationReportElevationEvent": "EPM Elevation Report - Elevation Events",
-            "EpmInsightsElevationTrend": "EPM Insights Elevation Trend",
-            "EpmInsightsMostFrequentElevations": "EPM Insights Most Frequent Elevations",
-            "EpmInsightsReport": "EPM Insights Report",
-            
-            # Device Settings & Configuration
-            "DeviceIntentPerSettingStatus": "Device Intent per Setting Status",
-            "DeviceInventoryPolicyStatusesV3": "Device Inventory Policy Status V3",
-            "DeviceInventoryPolicyStatusesWithPF": "Device Inventory Policy Status with PF",
-            "InventoryPolicyDeviceAggregatesV3": "Inventory Policy Device Aggregates V3",
-            "InventoryPolicyDeviceAggregatesWithPF": "Inventory Policy Device Aggregates with PF",
-            "PerSettingDeviceSummaryByConfigurationPolicy": "Per Setting Device Summary by Configuration Policy",
-            "PerSettingDeviceSummaryByConfigurationPolicyForAppControl": "Per Setting Device Summary for App Control",
-            "PerSettingDeviceSummaryByConfigurationPolicyForEDR": "Per Setting Device Summary for EDR",
-            "PerSettingDeviceSummaryByInventoryPolicy": "Per Setting Device Summary by Inventory Policy",
-            "PerSettingDeviceSummaryByInventoryPolicyV3": "Per Setting Device Summary by Inventory Policy V3",
-            "PerSettingSummaryByDeviceConfigurationPolicy": "Per Setting Summary by Device Configuration Policy",
-            "ADMXSettingsByDeviceByPolicy": "ADMX Settings by Device by Policy",
-            
-            # Co-management & Cloud Attached Devices
-            "ComanagedDeviceWorkloads": "Co-managed Device Workloads",
-            "ComanagementEligibilityTenantAttachedDevices": "Co-management Eligibility Tenant Attached Devices",
-            
-            # Group Policy Analytics
-            "GPAnalyticsSettingMigrationReadiness": "Group Policy Analytics Migration Readiness",
-            
-            # Security Tasks & Monitoring
-            "TicketingSecurityTaskAppsList": "Security Task Apps List",
-            "OrgDeviceInstallStatus": "Org Device Install Status",
-            
-            # Users & Remote Assistance
-            "Users": "All Users",
-            "AllGroupsInMyOrg": "All Groups in My Organization",
-            "RemoteAssistanceSessions": "Remote Assistance Sessions",
-            "UserScaleTest": "User Scale Test Report"
-        }
+        self.export_dataframe = None  # current_export_data as a DataFrame, built on first file export
+        self.export_dataframe_source = None
+        self.column_selected = set()  # Names of the columns ticked for export
+        self.column_filter_after_id = None  # Pending debounced column search
+        self.export_in_progress = False  # A filtered CSV/Excel file is being written in the background
+        self.export_enabled = False  # Mirrors the export button state for the keyboard shortcuts
+        
+        # Login page widgets are built once and reused after every logout
+        self.login_frame = None
+        
+        # Console log lines waiting for the next batched write (text, tag) - filled from worker threads too
+        self.log_queue = queue.SimpleQueue()
+        self.log_flush_scheduled = False
+        self.log_flush_lock = threading.Lock()  # Guards log_flush_scheduled
+        
+        # Report catalogs are module-level constants shared by every instance (treat as read-only)
+        self.available_reports = AVAILABLE_REPORTS
         
         # Parameter requirements for reports
-        self.report_parameter_requirements = {
-            # Reports requiring mandatory input
-            "AppInvByDevice": {
-                "requirement_level": "mandatory",
-                "icon": "🔴",
-                "parameters": {
-                    "deviceId": {"type": "device_selector", "required": True, "description": "Select target device"}
-                },
-                "description": "Requires specific device selection"
-            },
-            "DeviceRunStatesByProfiles": {
-                "requirement_level": "mandatory", 
-                "icon": "🔴",
-                "parameters": {
-                    "deviceId": {"type": "device_selector", "required": True, "description": "Select target device"}
-                },
-                "description": "Requires device context"
-            },
-            "FeatureUpdatePolicyFailuresAggregate": {
-                "requirement_level": "mandatory",
-                "icon": "🔴", 
-                "parameters": {
-                    "startDate": {"type": "date", "required": True, "description": "Start date for report"},
-                    "endDate": {"type": "date", "required": True, "description": "End date for report"}
-                },
-                "description": "Requires date range"
-            },
-            "QualityUpdatePolicyFailuresAggregate": {
-                "requirement_level": "mandatory",
-                "icon": "🔴",
-                "parameters": {
-                    "startDate": {"type": "date", "required": True, "description": "Start date for report"},
-                    "endDate": {"type": "date", "required": True, "description": "End date for report"}
-                },
-                "description": "Requires date range"
-            },
-            
-            # Reports with no parameters (changed from optional to none)
-            "Devices": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
-            "DevicesWithInventory": {"requirement_level": "none", "icon": "�", "description": "No input required"},
-            "PolicyNonCompliance": {"requirement_level": "none", "icon": "�", "description": "No input required"},
-
-            # Reports requiring no input (green)
-            "AllAppsList": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
-            "DefenderAgents": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
-            "Users": {"requirement_level": "none", "icon": "🟢", "description": "No input required"},
-            "AllGroupsInMyOrg": {"requirement_level": "none", "icon": "🟢", "description": "No input required"}
-        }
+        self.report_parameter_requirements = REPORT_PARAMETER_REQUIREMENTS
         
         # Current parameters for active export
         self.current_export_parameters = {}
@@ -1720,94 +2356,14 @@ class IntuneReportsGUI:
         self.user_permissions_cache = None
         self.user_access_level = 'unknown'
         self.filtered_available_reports = None
-        
-        # Permission test endpoints mapping for all 177 reports
-        self.permission_test_endpoints = {
-            # Security & Antivirus Reports
-            "ActiveMalware": "/deviceManagement/detectedApps",
-            "DefenderAgents": "/deviceManagement/managedDevices", 
-            "Malware": "/deviceManagement/detectedApps",
-            "UnhealthyDefenderAgents": "/deviceManagement/managedDevices",
-            "FirewallStatus": "/deviceManagement/managedDevices",
-            "FirewallUnhealthyStatus": "/deviceManagement/managedDevices",
-            
-            # Apps & Application Management
-            "AllAppsList": "/deviceAppManagement/mobileApps",
-            "FilteredAppsList": "/deviceAppManagement/mobileApps", 
-            "AppInstallStatusAggregate": "/deviceAppManagement/mobileApps",
-            "AppInvAggregate": "/deviceAppManagement/mobileApps",
-            "AppInvByDevice": "/deviceAppManagement/mobileApps",
-            "AppInvRawData": "/deviceAppManagement/mobileApps",
-            "CatalogAppsUpdateList": "/deviceAppManagement/mobileApps",
-            "DependentAppsInstallStatus": "/deviceAppManagement/mobileApps",
-            "DeviceInstallStatusByApp": "/deviceAppManagement/mobileApps",
-            "DevicesByAppInv": "/deviceAppManagement/mobileApps",
-            "OrgAppsInstallStatus": "/deviceAppManagement/mobileApps",
-            "OrgDeviceInstallStatus": "/deviceAppManagement/mobileApps",
-            "UserInstallStatusAggregateByApp": "/deviceAppManagement/mobileApps",
-            
-            # Mobile Application Management (MAM)
-            "MAMAppConfigurationStatus": "/deviceAppManagement/managedAppStatuses",
-            "MAMAppConfigurationStatusScopedV2": "/deviceAppManagement/managedAppStatuses",
-            "MAMAppConfigurationStatusV2": "/deviceAppManagement/managedAppStatuses",
-            "MAMAppProtectionStatus": "/deviceAppManagement/managedAppStatuses",
-            "MAMAppProtectionStatusScopedV2": "/deviceAppManagement/managedAppStatuses",
-            "MAMAppProtectionStatusV2": "/deviceAppManagement/managedAppStatuses",
-            
-            # Device Management & Inventory
-            "Devices": "/deviceManagement/managedDevices",
-            "DevicesWithInventory": "/deviceManagement/managedDevices",
-            "AllDeviceCertificates": "/deviceManagement/managedDevices",
-            "CertificatesByRAPolicy": "/deviceManagement/managedDevices",
-            "TpmAttestationStatus": "/deviceManagement/managedDevices",
-            "MEMUpgradeReadinessOrgAsset": "/deviceManagement/managedDevices",
-            
-            # Device Compliance
-            "DeviceCompliance": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "DeviceComplianceTrend": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "DeviceNonCompliance": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "DevicesWithoutCompliancePolicy": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "DevicesWithoutCompliancePolicyV3": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "NonCompliantDevicesByCompliancePolicy": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "NonCompliantDevicesByCompliancePolicyV3": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "NoncompliantDevicesAndSettings": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "NoncompliantDevicesAndSettingsV3": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "NoncompliantDevicesToBeRetired": "/deviceManagement/deviceCompliancePolicyDeviceStateSummary",
-            "NonCompliantCompliancePoliciesAggregate": "/deviceManagement/deviceCompliancePolicies",
-            "NonCompliantCompliancePoliciesAggregateV3": "/deviceManagement/deviceCompliancePolicies",
-            "NonCompliantConfigurationPoliciesAggregateWithPF": "/deviceManagement/deviceConfigurations",
-            "NonCompliantConfigurationPoliciesAggregateWithPFV3": "/deviceManagement/deviceConfigurations",
-            
-            # Configuration Policies
-            "ConfigurationPolicyAggregate": "/deviceManagement/deviceConfigurations",
-            "ConfigurationPolicyAggregateV3": "/deviceManagement/deviceConfigurations",
-            "ConfigurationPolicyDeviceAggregates": "/deviceManagement/deviceConfigurations",
-            "ConfigurationPolicyDeviceAggregatesV3": "/deviceManagement/deviceConfigurations",
-            "ConfigurationPolicyDeviceAggregatesWithPF": "/deviceManagement/deviceConfigurations",
-            "ConfigurationPolicyDeviceAggregatesWithPFV3": "/deviceManagement/deviceConfigurations",
-            "DeviceConfigurationPolicyStatuses": "/deviceManagement/deviceConfigurations",
-            "DeviceConfigurationPolicyStatusesV3": "/deviceManagement/deviceConfigurations",
-            "DeviceConfigurationPolicyStatusesWithPF": "/deviceManagement/deviceConfigurations",
-            "DeviceConfigurationPolicyStatusesWithPFV3": "/deviceManagement/deviceConfigurations",
-            "Policies": "/deviceManagement/deviceCompliancePolicies",
-            
-            # Default mapping for remaining reports - use managedDevices as it's commonly accessible
-        }
-        
-        # Add default endpoints for reports not explicitly mapped
-        for report_name in self.available_reports.keys():
-            if report_name not in self.permission_test_endpoints:
-                self.permission_test_endpoints[report_name] = "/deviceManagement/managedDevices"
+        self.index_reports(self.available_reports)  # Names offered in the report dropdown
         
         # Smart Parameter System for Reports requiring additional filters
-        self.report_parameters = self.initialize_report_parameters()
-        self.learned_parameters = {}  # Cache for dynamically learned parameters
+        self.report_parameters = REPORT_PARAMETERS
+        self.learned_parameters = OrderedDict()  # Cache for dynamically learned parameters (LRU)
         
         # Direct API Call Configuration - Reports that use GET calls instead of export jobs
-        self.direct_api_reports = self.initialize_direct_api_reports()
-        
-        # Initialize GUI
-        self.create_gui()
+        self.direct_api_reports = DIRECT_API_REPORTS
         
     def create_gui(self):
         """Create the main GUI"""
@@ -1820,215 +2376,33 @@ class IntuneReportsGUI:
         self.container = tk.Frame(self.root)
         self.container.pack(fill='both', expand=True)
         
-        # Show login page immediately
-        self.show_login_page()
+        # Reuse a still-valid cached token on warm starts, otherwise show login page
+        if self.load_cached_token():
+            self.show_reports_page()
+        else:
+            self.show_login_page()
         
         # Bind keyboard shortcuts
-        self.root.bind('<Control-e>', lambda e: self.export_report() if hasattr(self, 'export_btn') and self.export_btn['state'] == 'normal' else None)
+        self.root.bind('<Control-e>', self.on_export_shortcut)
         self.root.bind('<Control-s>', lambda e: self.generate_filtered_csv() if hasattr(self, 'generate_btn') else None)
         self.root.bind('<Control-l>', lambda e: self.clear_console() if hasattr(self, 'console_text') else None)
-        self.root.bind('<F5>', lambda e: self.export_report() if hasattr(self, 'export_btn') and self.export_btn['state'] == 'normal' else None)
-        
-    def initialize_report_parameters(self):
-        """Initialize known parameter requirements for specific reports"""
-        from datetime import datetime, timedelta
-        
-        return {
-            # Windows Update Reports
-            "FeatureUpdateDeviceState": {
-                "required": {
-                    "filter": "PolicyId ne null",
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                },
-                "optional": {"top": 1000}
-            },
-            
-            "QualityUpdateDeviceStatusByPolicy": {
-                "required": {
-                    "filter": "PolicyId ne null",
-                    "startDate": "auto_7_days_ago", 
-                    "endDate": "auto_today"
-                }
-            },
-            
-            "WindowsUpdatePerPolicyPerDeviceStatus": {
-                "required": {
-                    "filter": "PolicyId ne null",
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                }
-            },
-            
-            # Enrollment & Autopilot Reports
-            "DeviceEnrollmentFailures": {
-                "required": {
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                },
-                "optional": {"filter": "FailureCategory ne null"}
-            },
-            
-            "EnrollmentActivity": {
-                "required": {
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                }
-            },
-            
-            "AutopilotV1DeploymentStatus": {
-                "required": {
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                }
-            },
-            
-            "AutopilotV2DeploymentStatus": {
-                "required": {
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                }
-            },
-            
-            # Compliance & Policy Reports
-            "DeviceStatusByCompliacePolicyReport": {
-                "required": {
-                    "filter": "PolicyId ne null"
-                },
-                "optional": {
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                }
-            },
-            
-            "DeviceStatusByCompliancePolicySettingReport": {
-                "required": {
-                    "filter": "PolicyId ne null AND SettingName ne null"
-                }
-            },
-            
-            # Endpoint Analytics Reports
-            "EADevicePerformance": {
-                "required": {
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                }
-            },
-            
-            "EAStartupPerfDevicePerformance": {
-                "required": {
-                    "startDate": "auto_30_days_ago",
-                    "endDate": "auto_today"
-                }
-            }
-        }
+        self.root.bind('<F5>', self.on_export_shortcut)
     
-    def initialize_direct_api_reports(self):
-        """Initialize reports that use direct GET API calls instead of export jobs"""
-        return {
-            "Users": {
-                "endpoint": "/users",
-                "base_url": "https://graph.microsoft.com/v1.0",
-                "required_permission": "User.ReadBasic.All",
-                "description": "Retrieves all users in the organization",
-                "parameters": {
-                    "$top": 999
-                }
-            },
-            
-            "AllGroupsInMyOrg": {
-                "endpoint": "/groups",
-                "base_url": "https://graph.microsoft.com/v1.0",
-                "required_permission": "Group.Read.All",
-                "description": "Retrieves all groups in the organization",
-                "parameters": {
-                    "$top": 999
-                }
-            },
-            
-            "OrgAppsInstallStatus": {
-                "endpoint": "/deviceAppManagement/mobileApps",
-                "base_url": "https://graph.microsoft.com/beta",
-                "required_permission": "DeviceManagementApps.Read.All",
-                "description": "Retrieves organization apps install status",
-                "parameters": {
-                    "$top": 999,
-                    "$filter": "isAssigned eq true"
-                }
-            },
-            
-            "OrgDeviceInstallStatus": {
-                "endpoint": "/deviceAppManagement/mobileApps",
-                "base_url": "https://graph.microsoft.com/beta",
-                "required_permission": "DeviceManagementApps.Read.All",
-                "description": "Retrieves organization device install status for apps",
-                "parameters": {
-                    "$top": 999,
-                    "$expand": "installSummary,deviceStatuses,userStatuses"
-                }
-            },
-            
-            "Devices": {
-                "endpoint": "/deviceManagement/managedDevices", 
-                "base_url": "https://graph.microsoft.com/beta",
-                "required_permission": "DeviceManagementManagedDevices.Read.All",
-                "description": "Retrieves all managed devices",
-                "parameters": {
-                    "$top": 999
-                }
-            },
-            
-            "AllAppsList": {
-                "endpoint": "/deviceAppManagement/mobileApps",
-                "base_url": "https://graph.microsoft.com/beta", 
-                "required_permission": "DeviceManagementApps.Read.All",
-                "description": "Retrieves all mobile applications",
-                "parameters": {
-                    "$top": 999
-                }
-            },
-            
-            "Policies": {
-                "endpoint": "/deviceManagement/deviceCompliancePolicies",
-                "base_url": "https://graph.microsoft.com/beta",
-                "required_permission": "DeviceManagementConfiguration.Read.All",
-                "description": "Retrieves all device compliance policies",
-                "parameters": {
-                    "$top": 999,
-                    "$expand": "deviceStatusOverview,userStatusOverview"
-                }
-            },
-            
-            "DevicesByAppInv": {
-                "endpoint": "/deviceAppManagement/mobileApps",
-                "base_url": "https://graph.microsoft.com/beta",
-                "required_permission": "DeviceManagementApps.Read.All",
-                "description": "Retrieves devices by app inventory",
-                "parameters": {
-                    "$top": 999
-                }
-            },
-            
-            "AppInvByDevice": {
-                "endpoint": "/deviceAppManagement/mobileApps",
-                "base_url": "https://graph.microsoft.com/beta",
-                "required_permission": "DeviceManagementApps.Read.All",
-                "description": "Retrieves app inventory by device",
-                "parameters": {
-                    "$top": 999
-                }
-            }
-        }
+    def on_export_shortcut(self, event):
+        """Run the export from a keyboard shortcut when the export button is enabled"""
+        if self.export_enabled:
+            self.export_report()
     
+    def set_export_enabled(self, enabled, **options):
+        """Enable or disable the export button, keeping export_enabled in step for the shortcuts"""
+        self.export_enabled = enabled
+        self.export_btn.config(state='normal' if enabled else 'disabled', **options)
+        
     def get_report_parameters(self, report_name):
         """Get complete parameters for a report using smart defaults and collected parameters"""
         try:
             # Start with base parameters
-            params = {
-                "reportName": report_name,
-                "format": "csv",
-                "localizationType": "LocalizedValuesAsAdditionalColumn"
-            }
+            params = dict(BASE_EXPORT_PARAMETERS, reportName=report_name)
             
             # First, apply any collected parameters from the parameter dialog
             if hasattr(self, 'current_export_parameters') and self.current_export_parameters:
@@ -2039,31 +2413,24 @@ class IntuneReportsGUI:
             
             # Check if we have specific configuration for this report
             elif report_name in self.report_parameters:
-                config = self.report_parameters[report_name]
-                params.update(self.apply_parameter_config(config))
+                params.update(self.apply_parameter_config(report_name))
                 self.log_message(f"Applied known parameters for {report_name}", 'info')
                 return params
             
             # Check if we've learned parameters for this report before
             if report_name in self.learned_parameters:
-                learned_params = self.learned_parameters[report_name].copy()
+                self.learned_parameters.move_to_end(report_name)
+                flags, learned_params = self.learned_parameters[report_name]
                 
                 # Check for special instructions
-                if "_remove_filter" in learned_params:
-                    # Remove filter from base params and from learned params
-                    if "filter" in params:
-                        del params["filter"]
-                    del learned_params["_remove_filter"]
+                if flags & self.LEARNED_REMOVE_FILTER:
+                    # Remove filter from base params
+                    params.pop("filter", None)
                     self.log_message(f"Removed problematic filter for {report_name}", 'info')
                 
-                if "_minimal_params" in learned_params:
+                if flags & self.LEARNED_MINIMAL_PARAMS:
                     # Use only the absolute minimum parameters
-                    params = {
-                        "reportName": report_name,
-                        "format": "csv",
-                        "localizationType": "LocalizedValuesAsAdditionalColumn"
-                    }
-                    del learned_params["_minimal_params"]
+                    params = dict(BASE_EXPORT_PARAMETERS, reportName=report_name)
                     self.log_message(f"Using minimal parameters for {report_name}", 'info')
                 
                 params.update(learned_params)
@@ -2081,64 +2448,51 @@ class IntuneReportsGUI:
         except Exception as e:
             self.log_message(f"Error building parameters for {report_name}: {str(e)}", 'warning')
             # Return basic parameters as fallback
-            return {
-                "reportName": report_name,
-                "format": "csv",
-                "localizationType": "LocalizedValuesAsAdditionalColumn"
-            }
+            return dict(BASE_EXPORT_PARAMETERS, reportName=report_name)
     
-    def apply_parameter_config(self, config):
-        """Apply parameter configuration with auto-calculated dates"""
-        from datetime import datetime, timedelta
-        
-        params = {}
-        
-        # Apply required parameters
-        if "required" in config:
-            for key, value in config["required"].items():
-                if value == "auto_30_days_ago":
-                    params[key] = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-                elif value == "auto_7_days_ago":
-                    params[key] = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-                elif value == "auto_today":
-                    params[key] = datetime.now().strftime("%Y-%m-%d")
-                else:
-                    params[key] = value
-        
-        # Apply optional parameters  
-        if "optional" in config:
-            for key, value in config["optional"].items():
-                params[key] = value
+    def get_default_date_range(self):
+        """Default report window - the last 30 days"""
+        now = datetime.now()
+        return {
+            "startDate": (now - timedelta(days=30)).strftime("%Y-%m-%d"),
+            "endDate": now.strftime("%Y-%m-%d")
+        }
+    
+    def apply_parameter_config(self, report_name):
+        """Apply a known report's parameter configuration with auto-calculated dates"""
+        compiled = COMPILED_REPORT_PARAMETERS[report_name]
+        params = dict(compiled["fixed"])
+        
+        # Date fields are filled from a single clock read
+        if compiled["dates"]:
+            now = datetime.now()
+            for key, days_ago in compiled["dates"]:
+                params[key] = (now - timedelta(days=days_ago)).strftime("%Y-%m-%d")
                 
         return params
     
     def apply_smart_defaults(self, report_name):
         """Set default values based on report type"""
-        from datetime import datetime, timedelta
-        
         params = {}
         report_lower = report_name.lower()
+        match = self.SMART_DEFAULTS_PATTERN.match(report_lower)
+        report_kind = match.lastgroup if match else None
+        has_appinv = "appinv" in report_lower
         
         # Date-based reports (updates, enrollment, etc.)
-        if any(word in report_lower for word in ["update", "feature", "quality", "enrollment", "autopilot"]):
-            params.update({
-                "startDate": (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"),
-                "endDate": datetime.now().strftime("%Y-%m-%d")
-            })
+        if report_kind == 'date':
+            params.update(self.get_default_date_range())
             
             # Update reports often need policy filters (but not app inventory)
-            if "update" in report_lower and "appinv" not in report_lower:
+            if "update" in report_lower and not has_appinv:
                 params["filter"] = "PolicyId ne null"
         
         # Performance and analytics reports
-        elif any(word in report_lower for word in ["performance", "analytics", "ea"]):
-            params.update({
-                "startDate": (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"),
-                "endDate": datetime.now().strftime("%Y-%m-%d")
-            })
+        elif report_kind == 'performance':
+            params.update(self.get_default_date_range())
         
         # Policy and compliance reports (but not app inventory)
-        elif any(word in report_lower for word in ["policy", "compliance", "setting"]) and "appinv" not in report_lower:
+        elif report_kind == 'policy' and not has_appinv:
             params["filter"] = "PolicyId ne null"
         
         # Device status reports
@@ -2151,57 +2505,47 @@ class IntuneReportsGUI:
         """Learn parameter requirements from API error responses"""
         try:
             error_message = error_response.get('error', {}).get('message', '').lower()
+            report_lower = report_name.lower()
             
             # Common parameter patterns from error messages
             learned_params = {}
+            flags = 0
             
             # Check for property errors first (like PolicyId not found)
             if "could not find a property named" in error_message:
                 self.log_message(f"Property error detected for {report_name}. This report doesn't support the attempted filter.", 'warning')
                 
                 # For reports like AppInvByDevice, we need minimal parameters
-                if "appinv" in report_name.lower():
+                if "appinv" in report_lower:
                     # App inventory reports typically just need basic parameters
-                    learned_params = {
-                        "_remove_filter": True,
-                        "_minimal_params": True
-                    }
+                    flags = self.LEARNED_REMOVE_FILTER | self.LEARNED_MINIMAL_PARAMS
                     self.log_message(f"Setting minimal parameters for app inventory report {report_name}", 'info')
                 else:
                     # For other property errors, try with dates but no filters
-                    from datetime import datetime, timedelta
-                    learned_params = {
-                        "startDate": (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"),
-                        "endDate": datetime.now().strftime("%Y-%m-%d"),
-                        "_remove_filter": True
-                    }
+                    learned_params = self.get_default_date_range()
+                    flags = self.LEARNED_REMOVE_FILTER
                 
             # Check for missing filters (if no property error)
             elif "filter" in error_message and "required" in error_message:
                 # Don't add PolicyId filter for app inventory or install status reports
-                if any(keyword in report_name.lower() for keyword in ["appinv", "installstatus", "orgdeviceinstallstatus", "deviceinstallstatus"]):
+                if any(keyword in report_lower for keyword in self.INSTALL_STATUS_REPORT_KEYWORDS):
                     # Try with date filters for app and install status reports
-                    from datetime import datetime, timedelta
-                    learned_params = {
-                        "startDate": (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"),
-                        "endDate": datetime.now().strftime("%Y-%m-%d")
-                    }
+                    learned_params = self.get_default_date_range()
                 else:
                     learned_params["filter"] = "PolicyId ne null"
                 
             # Check for date/time errors
             elif "date" in error_message or "time" in error_message:
-                from datetime import datetime, timedelta
-                learned_params.update({
-                    "startDate": (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"),
-                    "endDate": datetime.now().strftime("%Y-%m-%d")
-                })
+                learned_params.update(self.get_default_date_range())
             
-            if learned_params:
+            if learned_params or flags:
                 # Cache the learned parameters
-                self.learned_parameters[report_name] = learned_params
+                self.learned_parameters[report_name] = (flags, learned_params)
+                self.learned_parameters.move_to_end(report_name)
+                if len(self.learned_parameters) > self.MAX_LEARNED_REPORTS:
+                    self.learned_parameters.popitem(last=False)
                 self.log_message(f"Learned new parameters for {report_name}: {list(learned_params.keys())}", 'info')
-                return learned_params
+                return flags, learned_params
                 
         except Exception as e:
             self.log_message(f"Error learning from API response: {str(e)}", 'debug')
@@ -2210,16 +2554,28 @@ class IntuneReportsGUI:
 
     def show_login_page(self):
         """Show login page"""
-        # Clear container
+        # Clear container - the login page itself is kept for reuse
         for widget in self.container.winfo_children():
-            widget.destroy()
+            if widget is not self.login_frame:
+                widget.destroy()
+        
+        if self.login_frame is None:
+            self.build_login_page()
+        else:
+            # Reset what the previous sign-in left behind
+            self.login_status.config(text="Ready to authenticate", fg='#605e5c')
+            self.login_btn.config(state='normal', text="Sign in with Corporate Account")
+            self.update_toggle_appearance()
+        
+        self.login_frame.pack(fill='both', expand=True)
         
+    def build_login_page(self):
+        """Build the login page widgets (once - logouts reuse them)"""
         # Login page frame
-        login_frame = tk.Frame(self.container, bg='#f5f5f5')
-        login_frame.pack(fill='both', expand=True)
+        self.login_frame = tk.Frame(self.container, bg='#f5f5f5')
         
         # Center content
-        center_frame = tk.Frame(login_frame, bg='#f5f5f5')
+        center_frame = tk.Frame(self.login_frame, bg='#f5f5f5')
         center_frame.place(relx=0.5, rely=0.5, anchor='center')
         
         # Header
@@ -2296,9 +2652,12 @@ Export first, choose columns later!"""
         
     def show_reports_page(self):
         """Show reports page after login"""
-        # Clear container
+        # Clear container - the login page is only hidden so logout can reuse it
         for widget in self.container.winfo_children():
-            widget.destroy()
+            if widget is self.login_frame:
+                widget.pack_forget()
+            else:
+                widget.destroy()
         
         # Discover user permissions and filter available reports (like v1.3)
         self.refresh_available_reports()
@@ -2355,8 +2714,9 @@ Export first, choose columns later!"""
         self.export_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.export_tab, text="1. Export Report")
         
-        # Tab 2: Column Selection (initially hidden)
+        # Tab 2: Column Selection (initially hidden, built on the first export)
         self.columns_tab = ttk.Frame(self.notebook)
+        self.columns_tab_signature = None
         
         self.create_export_tab()
         
@@ -2379,16 +2739,8 @@ Export first, choose columns later!"""
         # Report dropdown with integrated search (editable combobox)
         self.selected_report = tk.StringVar()
         
-        # Use clean report names without visual indicators
-        available_reports_to_use = getattr(self, 'filtered_available_reports', self.available_reports)
-        
-        # Use clean report names directly
-        report_values = sorted(list(available_reports_to_use.keys()))
-        
-        # No display mapping needed since we're using actual report names
-        self.report_display_mapping = {name: name for name in report_values}
-        
-        self.sorted_reports = report_values
+        # Clean report names, sorted once when the available reports were last set
+        report_values = self.sorted_reports
         self.filtered_reports = report_values.copy()  # Track filtered results
         self.last_search_text = ""  # Track last search to avoid unnecessary updates
         
@@ -2447,6 +2799,7 @@ Export first, choose columns later!"""
                                    bg='#0078d4', fg='white', padx=15, pady=8, relief='flat',
                                    state='disabled')
         self.export_btn.pack(pady=20)
+        self.export_enabled = False
         
         # Progress bar
         self.progress = ttk.Progressbar(export_frame, mode='indeterminate')
@@ -2501,17 +2854,44 @@ Export first, choose columns later!"""
         self.log_message("Dynamic approach: Export all data, then select columns", 'success')
         
     def create_columns_tab(self):
-        """Create the column selection tab after export"""
-        # Clear existing content
-        for widget in self.columns_tab.winfo_children():
-            widget.destroy()
-            
+        """Show the column selection tab after export"""
         # Add tab if not already added
         try:
             self.notebook.add(self.columns_tab, text="2. Select Columns & Export")
         except:
             pass  # Tab already exists
         
+        # Same report and columns as the last export - keep the tab and the user's selection
+        signature = (tuple(self.current_columns), len(self.current_export_data), self.selected_report.get())
+        if signature != self.columns_tab_signature:
+            # Widgets are built once per reports page, later exports only refresh their contents
+            if not self.columns_tab.winfo_children():
+                self.build_columns_tab()
+            self.columns_tab_signature = signature
+            
+            self.columns_title_label.config(text=f"✅ Report '{self.selected_report.get()}' exported successfully")
+            self.columns_stats_label.config(text=f"📊 {len(self.current_columns)} columns • {len(self.current_export_data)} rows")
+            
+            # Selection state for every column, widgets only for the visible rows
+            self.column_selected = set(self.current_columns)
+            self.visible_columns = list(self.current_columns)
+            self.column_names_lower = [column.lower() for column in self.current_columns]  # Search keys
+            self.column_search.set('')
+            
+            self.columns_canvas.itemconfig(self.columns_empty_text,
+                                           state='hidden' if self.current_columns else 'normal')
+            
+            # Scroll region comes from the row count - no layout pass needed
+            self.update_canvas_scroll(reset_view=True)
+        
+        # Auto-switch to columns tab
+        self.notebook.select(self.columns_tab)
+        
+        # Update initial count
+        self.update_selection_count()
+    
+    def build_columns_tab(self):
+        """Build the column selection tab widgets (report-specific text is filled in by create_columns_tab)"""
         # Main frame with scrolling
         main_frame = tk.Frame(self.columns_tab)
         main_frame.pack(fill='both', expand=True, padx=15, pady=15)
@@ -2524,13 +2904,12 @@ Export first, choose columns later!"""
         header_frame = tk.Frame(top_frame, bg='#f3f9ff', relief='solid', bd=1)
         header_frame.pack(fill='x', pady=(0, 15), ipady=10)
         
-        instruction_text = f"✅ Report '{self.selected_report.get()}' exported successfully"
-        stats_text = f"📊 {len(self.current_columns)} columns • {len(self.current_export_data)} rows"
-        
-        tk.Label(header_frame, text=instruction_text, 
-                font=('Segoe UI', 13, 'bold'), bg='#f3f9ff', fg='#0078d4').pack(padx=20, pady=(5, 2))
-        tk.Label(header_frame, text=stats_text, 
-                font=('Segoe UI', 10), bg='#f3f9ff', fg='#605e5c').pack(padx=20, pady=(0, 5))
+        self.columns_title_label = tk.Label(header_frame, 
+                                            font=('Segoe UI', 13, 'bold'), bg='#f3f9ff', fg='#0078d4')
+        self.columns_title_label.pack(padx=20, pady=(5, 2))
+        self.columns_stats_label = tk.Label(header_frame, 
+                                            font=('Segoe UI', 10), bg='#f3f9ff', fg='#605e5c')
+        self.columns_stats_label.pack(padx=20, pady=(0, 5))
         
         # Export Actions Section - prominently placed
         export_section = tk.Frame(top_frame, bg='#fafafa', relief='solid', bd=1)
@@ -2618,12 +2997,12 @@ Export first, choose columns later!"""
         
         tk.Label(search_frame, text="🔍 Search:", font=('Segoe UI', 9), bg='#f9f9f9').pack(side='left', padx=(0, 5))
         self.column_search = tk.StringVar()
-        self.column_search.trace('w', self.filter_columns)
+        self.column_search.trace('w', self.schedule_column_filter)
         search_entry = ttk.Entry(search_frame, textvariable=self.column_search, width=20)
         search_entry.pack(side='left')
         
         # Selection counter
-        self.selection_counter = tk.Label(left_controls, text=f"Selected: {len(self.current_columns)} columns", 
+        self.selection_counter = tk.Label(left_controls, text="Selected: 0 columns", 
                                          font=('Segoe UI', 9, 'bold'), fg='#107c10', bg='#f9f9f9')
         self.selection_counter.pack(side='left', padx=15)
         
@@ -2644,91 +3023,66 @@ Export first, choose columns later!"""
         scroll_container.pack(fill='both', expand=True)
         scroll_container.pack_propagate(False)  # Maintain minimum height
         
-        # Create scrollable frame with better styling - increased height
+        # Scrollable canvas - checkboxes only exist for the rows in view (see render_column_checkboxes)
         canvas = tk.Canvas(scroll_container, bg='#fcfcfc', highlightthickness=0, height=400)
         scrollbar = ttk.Scrollbar(scroll_container, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg='#fcfcfc')
         
-        # Configure scrolling
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Re-render the visible rows whenever the view scrolls
+        def on_canvas_scroll(first, last):
+            scrollbar.set(first, last)
+            self.render_column_checkboxes()
+        canvas.configure(yscrollcommand=on_canvas_scroll)
         
-        canvas_frame = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        # Bind canvas width to the checkbox cell width - resizes are coalesced into one re-layout
+        # (height-only changes re-render through the scroll callback)
+        def apply_canvas_width(cell_width):
+            self.column_resize_after_id = None
+            self.column_cell_width = cell_width
+            self.update_canvas_scroll()
         
-        # Bind canvas width to scrollable frame width
         def configure_canvas_width(event):
-            canvas.itemconfig(canvas_frame, width=event.width)
+            cell_width = max(event.width // self.COLUMNS_PER_ROW, 250)
+            if self.column_resize_after_id:
+                self.root.after_cancel(self.column_resize_after_id)
+                self.column_resize_after_id = None
+            if cell_width != self.column_cell_width:
+                self.column_resize_after_id = self.root.after(self.COLUMN_RESIZE_DELAY_MS,
+                                                              lambda: apply_canvas_width(cell_width))
         canvas.bind('<Configure>', configure_canvas_width)
         
-        # Create checkboxes with better spacing and visibility
-        self.column_vars = {}
-        self.column_checkboxes = {}  # Store checkbox references for filtering
-        columns_per_row = 2  # Use 2 columns for better readability
-        
-        # Debug info
-        print(f"Creating {len(self.current_columns)} column checkboxes...")
-        if len(self.current_columns) == 0:
-            tk.Label(scrollable_frame, text="⚠️ No columns found in the exported data", 
-                    font=('Segoe UI', 12), fg='red', bg='#fcfcfc').pack(pady=20)
-        
-        for i, column in enumerate(self.current_columns):
-            var = tk.BooleanVar(value=True)
-            self.column_vars[column] = var
-            
-            row = i // columns_per_row
-            col = i % columns_per_row
-            
-            cb = tk.Checkbutton(scrollable_frame, text=column, variable=var,
-                               font=('Segoe UI', 10), anchor='w', bg='#ffffff',
-                               command=self.update_selection_count,
-                               wraplength=300, justify='left',
-                               activebackground='#e7f3ff', selectcolor='#ffffff',
-                               relief='solid', bd=1, padx=8, pady=4,
-                               highlightbackground='#cccccc')
-            cb.grid(row=row, column=col, sticky='ew', padx=8, pady=3, ipadx=5, ipady=2)
-            
-            # Store reference for filtering
-            self.column_checkboxes[column] = cb
-            print(f"Created checkbox for column: {column}")  # Debug
-        
-        # Configure grid columns to expand evenly
-        for col in range(columns_per_row):
-            scrollable_frame.columnconfigure(col, weight=1, minsize=250)
+        # Checkbox widgets are pooled and only placed on the visible rows
+        self.columns_canvas = canvas
+        self.column_cell_width = 250
+        self.column_resize_after_id = None
+        self.column_checkbox_pool = []  # (checkbutton, canvas window id, variable) triples, recycled while scrolling
+        self.columns_empty_text = canvas.create_text(20, 20, text="⚠️ No columns found in the exported data",
+                                                     anchor='nw', font=('Segoe UI', 12), fill='red',
+                                                     state='hidden')
         
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
-        
-        # Force canvas update
-        self.root.update_idletasks()
-        canvas.configure(scrollregion=canvas.bbox("all"))
-        
-        # Auto-switch to columns tab
-        self.notebook.select(self.columns_tab)
-        
-        # Update initial count
-        self.update_selection_count()
     
     def update_selection_count(self):
         """Update the selection counter"""
-        if hasattr(self, 'column_vars') and hasattr(self, 'selection_counter'):
-            selected = sum(1 for var in self.column_vars.values() if var.get())
-            total = len(self.column_vars)
+        if hasattr(self, 'selection_counter'):
+            selected = len(self.column_selected)
+            total = len(self.current_columns)
             self.selection_counter.config(text=f"✅ Selected: {selected} of {total} columns")
             
             # Update export status and button states
+            # (a running file export keeps its status text and disabled button until it finishes)
             if hasattr(self, 'export_status'):
                 if selected == 0:
-                    self.export_status.config(text="⚠️ No columns selected - Please select at least one column", fg='#d13438')
-                    self.generate_btn.config(state='disabled')
+                    if not self.export_in_progress:
+                        self.export_status.config(text="⚠️ No columns selected - Please select at least one column", fg='#d13438')
+                        self.generate_btn.config(state='disabled')
                     if hasattr(self, 'view_btn'):
                         self.view_btn.config(state='disabled')
                 else:
-                    self.export_status.config(text=f"📊 Ready to export {selected} columns × {len(self.current_export_data)} rows", fg='#107c10')
-                    self.generate_btn.config(state='normal')
+                    if not self.export_in_progress:
+                        self.export_status.config(text=f"📊 Ready to export {selected} columns × {len(self.current_export_data)} rows", fg='#107c10')
+                        self.generate_btn.config(state='normal')
                     if hasattr(self, 'view_btn'):
                         self.view_btn.config(state='normal')
                     
@@ -2738,75 +3092,118 @@ Export first, choose columns later!"""
     
     def select_all_columns(self):
         """Select all columns"""
-        for var in self.column_vars.values():
-            var.set(True)
+        self.column_selected = set(self.current_columns)
+        self.render_column_checkboxes()
         self.update_selection_count()
         self.log_message("All columns selected", 'info')
     
     def clear_all_columns(self):
         """Clear all column selections"""
-        for var in self.column_vars.values():
-            var.set(False)
+        self.column_selected.clear()
+        self.render_column_checkboxes()
         self.update_selection_count()
         self.log_message("All columns cleared", 'info')
     
     def select_common_columns(self):
         """Select commonly used columns"""
-        # Clear all first
-        self.clear_all_columns()
-        
-        # Common column patterns to look for
-        common_patterns = [
-            'name', 'id', 'user', 'device', 'status', 'state', 'date', 'time',
-            'compliance', 'version', 'manufacturer', 'model', 'serial'
-        ]
-        
-        selected_count = 0
-        for column, var in self.column_vars.items():
-            column_lower = column.lower()
-            if any(pattern in column_lower for pattern in common_patterns):
-                var.set(True)
-                selected_count += 1
+        # Replaces the current selection in one pass
+        self.column_selected = {column for column in self.current_columns
+                                if self.COMMON_COLUMN_PATTERN.search(column)}
         
+        self.render_column_checkboxes()
+        self.update_selection_count()
+        self.log_message(f"Selected {len(self.column_selected)} common columns", 'info')
+    
+    def toggle_column(self, column, selected):
+        """Record a column checkbox click"""
+        if selected:
+            self.column_selected.add(column)
+        else:
+            self.column_selected.discard(column)
         self.update_selection_count()
-        self.log_message(f"Selected {selected_count} common columns", 'info')
+    
+    def get_selected_columns(self):
+        """Selected column names in report order"""
+        return [column for column in self.current_columns if column in self.column_selected]
+    
+    def schedule_column_filter(self, *args):
+        """Debounce the column search - only filter once typing pauses"""
+        if self.column_filter_after_id:
+            self.root.after_cancel(self.column_filter_after_id)
+        self.column_filter_after_id = self.root.after(self.COLUMN_FILTER_DELAY_MS, self.filter_columns)
     
     def filter_columns(self, *args):
         """Filter columns based on search term"""
-        if not hasattr(self, 'column_checkboxes') or not hasattr(self, 'column_search'):
+        self.column_filter_after_id = None
+        if not hasattr(self, 'columns_canvas') or not hasattr(self, 'column_search'):
             return
             
         search_term = self.column_search.get().lower()
         
-        # Filter checkboxes based on search term
-        visible_count = 0
-        for column, checkbox in self.column_checkboxes.items():
-            if search_term == "" or search_term in column.lower():
-                checkbox.grid()  # Show checkbox
-                visible_count += 1
-            else:
-                checkbox.grid_remove()  # Hide checkbox
+        # Filter the column list - the checkbox rows are rendered from it
+        if search_term:
+            self.visible_columns = [column for column, column_lower in zip(self.current_columns, self.column_names_lower)
+                                    if search_term in column_lower]
+        else:
+            self.visible_columns = list(self.current_columns)
         
         # Update the canvas scroll region after filtering
         if hasattr(self, 'root'):
-            self.root.after_idle(lambda: self.update_canvas_scroll())
+            self.root.after_idle(lambda: self.update_canvas_scroll(reset_view=True))
     
-    def update_canvas_scroll(self):
+    def update_canvas_scroll(self, reset_view=False):
         """Update canvas scroll region"""
         try:
-            # Find the canvas (this is a bit hacky but works)
-            for widget in self.columns_tab.winfo_children():
-                if isinstance(widget, tk.Frame):
-                    for subwidget in widget.winfo_children():
-                        if isinstance(subwidget, ttk.LabelFrame):
-                            for container in subwidget.winfo_children():
-                                if isinstance(container, tk.Frame):
-                                    for canvas_widget in container.winfo_children():
-                                        if isinstance(canvas_widget, tk.Canvas):
-                                            canvas_widget.configure(scrollregion=canvas_widget.bbox("all"))
-                                            return
-        except:
-            pass
+            canvas = self.columns_canvas
+            total_rows = -(-len(self.visible_columns) // self.COLUMNS_PER_ROW)
+            canvas.configure(scrollregion=(0, 0, self.column_cell_width * self.COLUMNS_PER_ROW,
+                                           total_rows * self.COLUMN_ROW_HEIGHT))
+            if reset_view:
+                canvas.yview_moveto(0)
+            self.render_column_checkboxes()
+        except (tk.TclError, AttributeError):
+            pass  # Columns tab not built yet or already destroyed
+    
+    def render_column_checkboxes(self):
+        """Place pooled checkboxes on the column rows currently scrolled into view"""
+        canvas = self.columns_canvas
+        row_height = self.COLUMN_ROW_HEIGHT
+        per_row = self.COLUMNS_PER_ROW
+        total_rows = -(-len(self.visible_columns) // per_row)
+        
+        # Rows in view plus a little overscan either side
+        view_rows = max(canvas.winfo_height(), int(canvas['height'])) // row_height + 1
+        first_row = max(int(canvas.canvasy(0)) // row_height - self.COLUMN_OVERSCAN_ROWS, 0)
+        last_row = min(first_row + view_rows + 2 * self.COLUMN_OVERSCAN_ROWS, total_rows)
+        first_index = first_row * per_row
+        needed = max(last_row - first_row, 0) * per_row
+        
+        # Grow the pool on demand - existing checkboxes are reconfigured rather than recreated
+        # (one variable per pooled checkbox; column_selected is the source of truth)
+        while len(self.column_checkbox_pool) < needed:
+            var = tk.BooleanVar()
+            checkbox = tk.Checkbutton(canvas, variable=var, font=('Segoe UI', 10), anchor='w', bg='#ffffff',
+                                      justify='left',
+                                      activebackground='#e7f3ff', selectcolor='#ffffff',
+                                      relief='solid', bd=1, padx=8, pady=4,
+                                      highlightbackground='#cccccc')
+            checkbox.config(command=lambda checkbox=checkbox, var=var: self.toggle_column(checkbox.column, var.get()))
+            window = canvas.create_window(0, 0, window=checkbox, anchor='nw', state='hidden')
+            self.column_checkbox_pool.append((checkbox, window, var))
+        
+        cell_width = self.column_cell_width
+        for slot, (checkbox, window, var) in enumerate(self.column_checkbox_pool):
+            index = first_index + slot
+            if slot < needed and index < len(self.visible_columns):
+                column = self.visible_columns[index]
+                checkbox.column = column
+                checkbox.config(text=column)
+                var.set(column in self.column_selected)
+                row, col = divmod(index, per_row)
+                canvas.coords(window, col * cell_width + 8, row * row_height + 3)
+                canvas.itemconfig(window, width=cell_width - 16, height=row_height - 6, state='normal')
+            else:
+                canvas.itemconfig(window, state='hidden')
     
     def view_report_data(self):
         """Open a new window to view the report data in a table format"""
@@ -2823,12 +3220,14 @@ Export first, choose columns later!"""
             if not selected_report:
                 selected_report = "Report Data"
             
-            # Open the report viewer
+            # Open the report viewer - it shares the export's cached DataFrame instead of
+            # converting the rows again, and only ever renders the rows in view
             viewer = ReportViewer(
                 parent=self,
                 report_name=selected_report,
-                data=self.current_export_data,
-                columns=self.current_columns
+                data=self.get_export_dataframe(self.current_export_data),
+                columns=self.current_columns,
+                records=self.current_export_data
             )
             
             # Update status
@@ -2839,13 +3238,22 @@ Export first, choose columns later!"""
             messagebox.showerror("Viewer Error", error_msg)
             self.log_message(error_msg, 'error')
     
+    def get_export_dataframe(self, export_data):
+        """Export rows as a DataFrame - built once per export, reused for every column selection"""
+        if self.export_dataframe_source is not export_data:
+            # object dtype keeps ints/strings exactly as exported
+            self.export_dataframe = pd.DataFrame(export_data, dtype=object)
+            self.export_dataframe_source = export_data
+        return self.export_dataframe
+    
     def generate_filtered_csv(self):
         """Generate CSV with only selected columns and show immediate feedback"""
+        # One file write at a time (Ctrl+S bypasses the disabled button)
+        if self.export_in_progress:
+            return
+        
         # Get selected columns
-        selected_columns = []
-        for column, var in self.column_vars.items():
-            if var.get():
-                selected_columns.append(column)
+        selected_columns = self.get_selected_columns()
         
         if not selected_columns:
             messagebox.showwarning("No Columns Selected", "Please select at least one column")
@@ -2869,86 +3277,94 @@ Export first, choose columns later!"""
         if not filepath:
             return
         
+        # Update UI to show progress
+        file_type = "Excel" if filepath.lower().endswith('.xlsx') else "CSV"
+        self.export_in_progress = True
+        self.export_status.config(text=f"📝 Creating {file_type} file...", fg='#0078d4')
+        self.generate_btn.config(state='disabled', text="📝 Creating...")
+        
+        # Create metadata (Tk variables are read here - the worker thread must not touch them)
+        metadata = {
+            'original_report': self.selected_report.get(),
+            'export_time': datetime.now().isoformat(),
+            'user': self.user_info.get('displayName', 'Unknown') if self.user_info else 'Unknown',
+            'total_columns_available': len(self.current_columns),
+            'selected_columns_count': len(selected_columns),
+            'selected_columns': selected_columns,
+            'excluded_columns': [col for col in self.current_columns if col not in self.column_selected],
+            'total_rows': len(self.current_export_data),
+            'file_format': file_type.lower(),
+            'file_path': filepath
+        }
+        
+        # Write the file in the background so large exports don't freeze the window
+        thread = threading.Thread(target=self.filtered_export_thread,
+                                  args=(filepath, file_type, selected_columns, self.current_export_data, metadata))
+        thread.daemon = True
+        thread.start()
+    
+    def filtered_export_thread(self, filepath, file_type, selected_columns, export_data, metadata):
+        """Thread for writing the filtered CSV/Excel file and its metadata"""
         try:
-            # Update UI to show progress
-            self.export_status.config(text="📝 Creating CSV file...", fg='#0078d4')
-            self.generate_btn.config(state='disabled', text="📝 Creating...")
-            self.root.update()
+            # Project the selected columns (missing values are written as empty cells)
+            df = self.get_export_dataframe(export_data).reindex(columns=selected_columns)
             
             # Create filtered CSV
-            if filepath.lower().endswith('.xlsx'):
+            if file_type == "Excel":
                 # Export as Excel
-                import pandas as pd
-                df_data = []
-                for row in self.current_export_data:
-                    filtered_row = {col: row.get(col, '') for col in selected_columns}
-                    df_data.append(filtered_row)
-                
-                df = pd.DataFrame(df_data)
                 df.to_excel(filepath, index=False)
-                file_type = "Excel"
             else:
                 # Export as CSV
-                with open(filepath, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=selected_columns)
-                    writer.writeheader()
-                    
-                    # Write filtered data
-                    for row in self.current_export_data:
-                        filtered_row = {col: row.get(col, '') for col in selected_columns}
-                        writer.writerow(filtered_row)
-                file_type = "CSV"
-            
-            # Create metadata
-            metadata = {
-                'original_report': self.selected_report.get(),
-                'export_time': datetime.now().isoformat(),
-                'user': self.user_info.get('displayName', 'Unknown') if self.user_info else 'Unknown',
-                'total_columns_available': len(self.current_columns),
-                'selected_columns_count': len(selected_columns),
-                'selected_columns': selected_columns,
-                'excluded_columns': [col for col in self.current_columns if col not in selected_columns],
-                'total_rows': len(self.current_export_data),
-                'file_format': file_type.lower(),
-                'file_path': filepath
-            }
+                df.to_csv(filepath, index=False, encoding='utf-8-sig')
             
-            metadata_file = filepath.replace(filepath.split('.')[-1], 'json')
+            metadata_file = os.path.splitext(filepath)[0] + '.json'  # Same name, only the extension swapped
             with open(metadata_file, 'w', encoding='utf-8') as f:
                 json.dump(metadata, f, indent=2)
             
-            # Update UI with success
             file_size = os.path.getsize(filepath)
-            file_size_mb = file_size / (1024 * 1024)
-            
-            self.export_status.config(text=f"✅ {file_type} file created successfully!", fg='#107c10')
-            # Update status with file details instead of separate file_info label
-            detailed_status = f"✅ {file_type} created: {os.path.basename(filepath)} ({file_size_mb:.2f} MB)"
-            self.export_status.config(text=detailed_status, fg='#107c10')
-            
-            self.log_message(f"Filtered {file_type} generated successfully!", 'success')
-            self.log_message(f"File: {filepath}", 'success')
-            self.log_message(f"Selected {len(selected_columns)} of {len(self.current_columns)} columns", 'info')
-            self.log_message(f"File size: {file_size_mb:.2f} MB", 'info')
-            
-            # Show success dialog without automatic folder opening
-            messagebox.showinfo(
-                "Export Complete!", 
-                f"✅ {file_type} file created successfully!\n\n"
-                f"📁 File: {os.path.basename(filepath)}\n"
-                f"📊 Data: {len(selected_columns)} columns × {len(self.current_export_data)} rows\n"
-                f"💾 Size: {file_size_mb:.2f} MB\n\n"
-                f"📂 Saved to: {os.path.dirname(filepath)}")
-            
-            # No automatic folder opening - let user access file manually
-                    
+            self.root.after(0, lambda: self.on_filtered_export_complete(filepath, file_type, metadata, file_size))
+            
         except Exception as e:
-            self.export_status.config(text="❌ Export failed", fg='#d13438')
-            self.log_message(f"Failed to generate CSV: {str(e)}", 'error')
-            messagebox.showerror("Export Failed", f"Failed to generate filtered CSV:\n\n{str(e)}")
-        finally:
-            # Restore button
-            self.generate_btn.config(state='normal', text="📥 Export CSV")
+            error = str(e)
+            self.root.after(0, lambda: self.on_filtered_export_failed(error))
+    
+    def on_filtered_export_complete(self, filepath, file_type, metadata, file_size):
+        """Show the result of a finished filtered export"""
+        # Update UI with success
+        file_size_mb = file_size / (1024 * 1024)
+        
+        # Status shows the file details instead of a separate file_info label
+        detailed_status = f"✅ {file_type} created: {os.path.basename(filepath)} ({file_size_mb:.2f} MB)"
+        self.export_status.config(text=detailed_status, fg='#107c10')
+        self.restore_generate_button()
+        
+        self.log_message(f"Filtered {file_type} generated successfully!\n"
+                         f"    File: {filepath}", 'success')
+        self.log_message(f"Selected {metadata['selected_columns_count']} of {metadata['total_columns_available']} columns, "
+                         f"file size: {file_size_mb:.2f} MB", 'info')
+        
+        # Show success dialog without automatic folder opening
+        messagebox.showinfo(
+            "Export Complete!", 
+            f"✅ {file_type} file created successfully!\n\n"
+            f"📁 File: {os.path.basename(filepath)}\n"
+            f"📊 Data: {metadata['selected_columns_count']} columns × {metadata['total_rows']} rows\n"
+            f"💾 Size: {file_size_mb:.2f} MB\n\n"
+            f"📂 Saved to: {os.path.dirname(filepath)}")
+        
+        # No automatic folder opening - let user access file manually
+    
+    def restore_generate_button(self):
+        """End a filtered export - the button follows the current column selection again"""
+        self.export_in_progress = False
+        self.generate_btn.config(state='normal' if self.column_selected else 'disabled', text="📥 Export CSV")
+    
+    def on_filtered_export_failed(self, error):
+        """Report a failed filtered export"""
+        self.export_status.config(text="❌ Export failed", fg='#d13438')
+        self.restore_generate_button()
+        self.log_message(f"Failed to generate CSV: {error}", 'error')
+        messagebox.showerror("Export Failed", f"Failed to generate filtered CSV:\n\n{error}")
     
     def on_search_type(self, event):
         """Handle real-time search as user types in the dropdown"""
@@ -2964,27 +3380,18 @@ Export first, choose columns later!"""
             
         self.last_search_text = search_text
         
-        # Use clean report names for search
-        available_reports = getattr(self, 'filtered_available_reports', None)
-        if available_reports is None:
-            available_reports = getattr(self, 'available_reports', {})
-        if not available_reports:
-            available_reports = {}
-        
         if not search_text:
             # If search is empty, show all available reports (clean names)
-            self.filtered_reports = sorted(list(available_reports.keys()))
+            self.filtered_reports = self.sorted_reports.copy()
             self.report_desc.config(text="Select a report to export all available data")
         else:
-            # Filter reports that contain the search text
-            self.filtered_reports = []
-            for report_name in sorted(available_reports.keys()):
-                report_description = available_reports[report_name].lower()
-                report_key_lower = report_name.lower()
-                
-                if (search_text in report_key_lower or 
-                    search_text in report_description):
-                    self.filtered_reports.append(report_name)
+            # Filter reports whose name or description contains the search text
+            # (typing more characters only needs to re-check the previous matches)
+            cached_text, cached_matches = self.report_search_cache
+            candidates = cached_matches if search_text.startswith(cached_text) else self.report_search_index
+            matches = [entry for entry in candidates if search_text in entry[1] or search_text in entry[2]]
+            self.report_search_cache = (search_text, matches)
+            self.filtered_reports = [entry[0] for entry in matches]
             
             # Update status
             matching_count = len(self.filtered_reports)
@@ -3061,12 +3468,12 @@ Export first, choose columns later!"""
             # Reset search tracking
             self.last_search_text = selected.lower()
             # Reset to show all available reports for next search
-            sorted_available = sorted(list(available_reports.keys()))
+            sorted_available = self.sorted_reports
             self.filtered_reports = sorted_available.copy()
             self.report_combo['values'] = sorted_available
             
             # Enable export button when valid report is selected
-            self.export_btn.config(state='normal')
+            self.set_export_enabled(True)
             
             # Update export button text based on parameter requirements
             if param_info and param_info['requirement_level'] == 'mandatory':
@@ -3080,11 +3487,11 @@ Export first, choose columns later!"""
             self.report_desc.config(text="Select a report to export all available data")
             self.last_search_text = ""
             # Reset to show all available reports
-            sorted_available = sorted(list(available_reports.keys())) if hasattr(self, 'filtered_available_reports') else self.sorted_reports
+            sorted_available = self.sorted_reports
             self.filtered_reports = sorted_available.copy()
             self.report_combo['values'] = sorted_available
             # Disable both export buttons when no report is selected
-            self.export_btn.config(state='disabled', text="📥 Export Report")
+            self.set_export_enabled(False, text="📥 Export Report")
     
     def get_parameter_info(self, report_name):
         """Get parameter information for a report with auto-detection fallback"""
@@ -3124,13 +3531,14 @@ Export first, choose columns later!"""
     
     def authenticate(self):
         """OAuth2 authentication flow"""
+        server = None
         try:
-            port = self.find_free_port()
-            callback_url = f"http://localhost:{port}/callback"
-            
-            server = HTTPServer(('localhost', port), AuthCallbackHandler)
-            server.timeout = 300
+            # One callback server per login - closed again once the flow ends
+            server = HTTPServer(('localhost', self.find_free_port()), AuthCallbackHandler)
             server.auth_code = None
+            server.callback_received = False
+            port = server.server_address[1]
+            callback_url = f"http://localhost:{port}/callback"
             
             # Build auth URL
             params = {
@@ -3150,12 +3558,12 @@ Export first, choose columns later!"""
             self.root.after(0, lambda: self.login_status.config(
                 text="Waiting for authentication...", fg='#0078d4'))
             
-            # Wait for callback
-            start_time = time.time()
-            while time.time() - start_time < 300:
+            # Wait for callback (keep serving until the /callback request itself arrives)
+            deadline = time.time() + 300
+            while not server.callback_received and time.time() < deadline:
+                server.timeout = deadline - time.time()
                 try:
                     server.handle_request()
-                    break
                 except socket.timeout:
                     continue
             
@@ -3175,7 +3583,7 @@ Export first, choose columns later!"""
                 
                 token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
                 timeout = self.timeout_manager.get_timeout_for_operation('authentication')
-                response = requests.post(token_url, data=token_data, timeout=timeout)
+                response = self.session.post(token_url, data=token_data, timeout=timeout)
                 
                 if response.status_code == 200:
                     token_info = response.json()
@@ -3183,18 +3591,18 @@ Export first, choose columns later!"""
                     self.refresh_token = token_info.get('refresh_token')
                     
                     # Track token expiry
-                    from datetime import datetime, timedelta
                     expires_in = token_info.get('expires_in', 3600)  # Default 1 hour
                     self.token_issued_at = datetime.now()
                     self.token_expires_at = self.token_issued_at + timedelta(seconds=expires_in)
                     
                     # Get user info
                     headers = {'Authorization': f'Bearer {self.access_token}'}
-                    user_response = requests.get(f"{self.graph_base_url}/me", headers=headers)
+                    user_response = self.session.get(f"{self.graph_base_url}/me", headers=headers)
                     
                     if user_response.status_code == 200:
                         self.user_info = user_response.json()
                         user_name = self.user_info.get('displayName', 'User')
+                        self.save_token_cache()
                         
                         self.root.after(0, lambda: self.login_status.config(
                             text=f"Authentication successful! Welcome {user_name}", fg='#107c10'))
@@ -3217,6 +3625,10 @@ Export first, choose columns later!"""
             self.root.after(0, lambda: self.login_status.config(
                 text=f"Authentication error: {str(e)}", fg='#d13438'))
             self.reset_login_button()
+        finally:
+            # Don't leave a localhost listener open for the rest of the session
+            if server is not None:
+                server.server_close()
     
     def parse_error_response(self, response):
         """Parse error information from API response"""
@@ -3238,6 +3650,15 @@ Export first, choose columns later!"""
             state='normal', text="Sign in with Corporate Account"))
     
     def refresh_access_token(self, max_retries=3):
+        """Refresh the access token - concurrent workers share one refresh instead of racing"""
+        stale_token = self.access_token
+        with self.token_refresh_lock:
+            # Another worker already refreshed the token while this one waited for the lock
+            if self.access_token and self.access_token != stale_token:
+                return True
+            return self.refresh_access_token_with_retries(max_retries)
+    
+    def refresh_access_token_with_retries(self, max_retries=3):
         """Enhanced token refresh with retry logic and expiry tracking"""
         try:
             if not self.refresh_token:
@@ -3260,7 +3681,7 @@ Export first, choose columns later!"""
             for attempt in range(max_retries):
                 try:
                     timeout = self.timeout_manager.get_timeout_for_operation('token_refresh')
-                    token_response = requests.post(token_url, data=token_data, timeout=timeout)
+                    token_response = self.session.post(token_url, data=token_data, timeout=timeout)
                     
                     if token_response.status_code == 200:
                         token_info = token_response.json()
@@ -3271,12 +3692,12 @@ Export first, choose columns later!"""
                             self.refresh_token = token_info['refresh_token']
                         
                         # Calculate token expiry (default 1 hour if not specified)
-                        from datetime import datetime, timedelta
                         expires_in = token_info.get('expires_in', 3600)  # Default 1 hour
                         self.token_issued_at = datetime.now()
                         self.token_expires_at = self.token_issued_at + timedelta(seconds=expires_in)
                         
                         self.log_message(f"✅ Access token refreshed successfully (expires at {self.token_expires_at.strftime('%H:%M:%S')})", 'success')
+                        self.save_token_cache()
                         return True
                     
                     elif token_response.status_code == 400:
@@ -3289,6 +3710,7 @@ Export first, choose columns later!"""
                             self.access_token = None
                             self.refresh_token = None
                             self.token_expires_at = None
+                            self.clear_token_cache()
                             return False
                         
                         self.log_message(f"❌ Token refresh failed (400): {token_response.text}", 'error')
@@ -3338,12 +3760,119 @@ Export first, choose columns later!"""
             self.log_message(f"❌ Error refreshing token: {str(e)}", 'error')
             return False
     
+    def get_token_cache_path(self):
+        """Get the per-user token cache location (%LOCALAPPDATA%\\HTMD\\token.json on Windows)"""
+        local_appdata = os.environ.get('LOCALAPPDATA')
+        if local_appdata:
+            return os.path.join(local_appdata, 'HTMD', 'token.json')
+        return os.path.join(os.path.expanduser('~'), '.htmd', 'token.json')
+    
+    def save_token_cache(self):
+        """Persist the current access token so the next start can skip the browser sign-in"""
+        if not self.access_token or not self.token_expires_at:
+            return
+        
+        # Only the short-lived access token is cached - the refresh token never goes to disk
+        payload = json.dumps({
+            'tenant_id': self.tenant_id,
+            'client_id': self.client_id,
+            'access_token': self.access_token,
+            'expires_at': self.token_expires_at.timestamp(),  # Wall-clock epoch, valid across runs
+            'user_info': self.user_info
+        }).encode('utf-8')
+        
+        # Encrypt with Windows DPAPI (pywin32) - without it nothing is cached at all
+        try:
+            import win32crypt
+            payload = win32crypt.CryptProtectData(payload, 'HTMD token cache', None, None, None, 0)
+        except Exception:
+            return
+        
+        cache = {'dpapi': True, 'data': base64.b64encode(payload).decode('ascii')}
+        try:
+            os.makedirs(os.path.dirname(self.token_cache_path), exist_ok=True)
+            # Owner-only permissions where the OS supports them
+            fd = os.open(self.token_cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass  # Caching is best effort, next start just signs in again
+    
+    def load_cached_token(self):
+        """Restore a cached token if it is still valid for this tenant and app"""
+        try:
+            with open(self.token_cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            
+            # Only DPAPI-protected caches are ever written - anything else is not ours
+            if not cache.get('dpapi'):
+                self.clear_token_cache()
+                return False
+            import win32crypt
+            payload = win32crypt.CryptUnprotectData(base64.b64decode(cache['data']), None, None, None, 0)[1]
+            token = json.loads(payload.decode('utf-8'))
+        except Exception:
+            return False
+        
+        # Only reuse a token issued for the same tenant/app that outlives the 5-minute refresh
+        # buffer (token_expires_soon) - no refresh token is cached, so it could not be renewed
+        if token.get('tenant_id') != self.tenant_id or token.get('client_id') != self.client_id:
+            self.clear_token_cache()
+            return False
+        if not token.get('access_token') or token.get('expires_at', 0) <= time.time() + 10 * 60:
+            self.clear_token_cache()
+            return False
+        
+        self.access_token = token['access_token']
+        self.token_expires_at = datetime.fromtimestamp(token['expires_at'])
+        self.user_info = token.get('user_info') or {}
+        return True
+    
+    def clear_token_cache(self):
+        """Remove the cached token file"""
+        try:
+            os.remove(self.token_cache_path)
+        except OSError:
+            pass
+    
+    def get_list_cache_dir(self):
+        """Folder holding the device/policy list caches, next to the token file"""
+        return os.path.join(os.path.dirname(self.token_cache_path), 'cache')
+    
+    def get_list_cache_path(self, list_name):
+        """Get the gzip cache file for a tenant's device/policy list"""
+        # Note: these files are not encrypted and hold device names, user names and UPNs -
+        # they are deleted on logout (clear_list_cache)
+        return os.path.join(self.get_list_cache_dir(), f"{self.tenant_id}_{list_name}.json.gz")
+    
+    def clear_list_cache(self):
+        """Remove the cached device/policy lists"""
+        shutil.rmtree(self.get_list_cache_dir(), ignore_errors=True)
+    
+    def load_list_cache(self, list_name):
+        """Read a cached Graph list - returns (etag, items) or (None, None)"""
+        try:
+            with gzip.open(self.get_list_cache_path(list_name), 'rt', encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache.get('etag'), cache['items']
+        except (OSError, ValueError, KeyError):
+            return None, None
+    
+    def save_list_cache(self, list_name, items, etag=None):
+        """Write a Graph list and its ETag to the disk cache"""
+        cache_path = self.get_list_cache_path(list_name)
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with gzip.open(cache_path, 'wt', encoding='utf-8') as f:
+                json.dump({'etag': etag, 'items': items}, f)
+        except OSError:
+            pass  # Caching is best effort
+    
     def token_expires_soon(self, buffer_minutes=5):
         """Check if token expires within buffer_minutes"""
         if not self.token_expires_at:
             return False
         
-        from datetime import datetime, timedelta
         buffer_time = datetime.now() + timedelta(minutes=buffer_minutes)
         return buffer_time >= self.token_expires_at
     
@@ -3355,7 +3884,6 @@ Export first, choose columns later!"""
         if not self.token_expires_at:
             return True  # Assume valid if no expiry info
         
-        from datetime import datetime
         return datetime.now() < self.token_expires_at
 
     def make_authenticated_request(self, method, url, operation_type='api_call', max_retries=3, **kwargs):
@@ -3392,7 +3920,7 @@ Export first, choose columns later!"""
                 # Make the request
                 self.log_message(f"Making {method.upper()} request to {url} (attempt {attempt + 1}/{max_retries})", 'debug')
                 
-                response = requests.request(method, url, **kwargs)
+                response = self.session.request(method, url, **kwargs)
                 last_response = response
                 
                 self.log_message(f"Response: HTTP {response.status_code}", 'debug')
@@ -3402,6 +3930,10 @@ Export first, choose columns later!"""
                     # Success
                     return response
                 
+                elif response.status_code == 304:
+                    # Not modified - only sent back for If-None-Match requests, caller keeps its cached copy
+                    return response
+                
                 elif response.status_code == 401:
                     # Unauthorized - token expired or invalid
                     self.log_message("⚠️ Authentication failed (401), attempting token refresh...", 'warning')
@@ -3725,7 +4257,6 @@ Export first, choose columns later!"""
             if response and response.status_code == 200:
                 data = response.json()
                 if 'value' in data and data['value']:
-                    import pandas as pd
                     return pd.DataFrame(data['value'])
             
             return None
@@ -3753,6 +4284,7 @@ Export first, choose columns later!"""
             return {
                 "requirement_level": "none",
                 "icon": "�",
+                "parameters": {},
                 "description": "No input required"
             }
         
@@ -3761,6 +4293,7 @@ Export first, choose columns later!"""
             return {
                 "requirement_level": "none",
                 "icon": "�",
+                "parameters": {},
                 "description": "No input required"
             }
         
@@ -3769,6 +4302,7 @@ Export first, choose columns later!"""
             return {
                 "requirement_level": "none",
                 "icon": "�",
+                "parameters": {},
                 "description": "No input required"
             }
         
@@ -3776,6 +4310,7 @@ Export first, choose columns later!"""
         return {
             "requirement_level": "none",
             "icon": "�",
+            "parameters": {},
             "description": "No input required"
         }
 
@@ -3786,7 +4321,7 @@ Export first, choose columns later!"""
             self.log_message("Loading reports interface - permission checking in background", 'info')
             
             # Show all reports immediately so user can see the interface
-            self.filtered_available_reports = self.available_reports.copy()
+            self.set_filtered_available_reports(self.available_reports.copy())
             
             # Start permission discovery in background (non-blocking)
             threading.Thread(target=self.discover_permissions_background, daemon=True).start()
@@ -3798,15 +4333,23 @@ Export first, choose columns later!"""
         except Exception as e:
             self.log_message(f"Error refreshing available reports: {str(e)}", 'error')
             # Fallback to showing all reports
-            self.filtered_available_reports = self.available_reports.copy()
+            self.set_filtered_available_reports(self.available_reports.copy())
             return False
+    
+    def set_filtered_available_reports(self, reports):
+        """Set the reports offered for export, sorting their names once for the dropdown"""
+        self.filtered_available_reports = reports
+        self.index_reports(reports)
+    
+    def index_reports(self, reports):
+        """Sort the dropdown report names and lowercase names/descriptions once for the search box"""
+        self.sorted_reports = sorted(reports)
+        self.report_search_index = [(name, name.lower(), reports[name].lower()) for name in self.sorted_reports]
+        self.report_search_cache = ("", self.report_search_index)  # (search text, matching index entries)
 
     def discover_permissions_background(self):
         """Discover user permissions in background and update UI when complete"""
         try:
-            import threading
-            import time
-            
             # Add a small delay to let UI finish loading
             time.sleep(1)
             
@@ -3825,7 +4368,7 @@ Export first, choose columns later!"""
             try:
                 # Test device management access
                 test_url = f"{self.graph_base_url}/deviceManagement/managedDevices?$top=1"
-                response = requests.get(test_url, headers=headers, timeout=10)
+                response = self.session.get(test_url, headers=headers, timeout=10)
                 
                 if response.status_code in [200, 206]:
                     # User has device management access - likely admin
@@ -3849,11 +4392,17 @@ Export first, choose columns later!"""
 
     def logout(self):
         """Logout and return to login"""
+        self.clear_token_cache()
+        self.clear_list_cache()
         self.access_token = None
         self.refresh_token = None
         self.user_info = None
         self.current_export_data = None
         self.current_columns = []
+        self.export_dataframe = None
+        self.export_dataframe_source = None
+        self.column_selected = set()
+        self.export_in_progress = False  # A pending write's callbacks can't reach the destroyed tab
         # Clear permission cache for next user
         self.user_permissions_cache = None
         self.filtered_available_reports = None
@@ -3921,7 +4470,7 @@ Export first, choose columns later!"""
     def export_direct_api_report(self, report_name):
         """Export reports using direct API GET calls"""
         # Disable export button and start progress
-        self.export_btn.config(state='disabled')
+        self.set_export_enabled(False)
         self.progress.start()
         self.progress_label.config(text="Starting direct API export...")
         
@@ -3934,7 +4483,7 @@ Export first, choose columns later!"""
     def export_via_export_job(self, report_name):
         """Export reports using traditional export job method"""
         # Disable export button and start progress
-        self.export_btn.config(state='disabled')
+        self.set_export_enabled(False)
         self.progress.start()
         self.progress_label.config(text="Starting export job...")
         
@@ -3954,7 +4503,7 @@ Export first, choose columns later!"""
             endpoint = report_config["endpoint"]
             base_url = report_config["base_url"]
             required_permission = report_config["required_permission"]
-            default_parameters = report_config["parameters"].copy()
+            default_parameters = report_config["parameters"]
             
             # Collect user-provided parameters if parameter dialog was used
             user_parameters = {}
@@ -3982,15 +4531,18 @@ Export first, choose columns later!"""
                     self.log_message(filter_text, 'info')
                     self.root.after(0, lambda: self.progress_label.config(text=f"Filtering data: {', '.join(filter_info)}"))
             
-            # Merge user parameters with default parameters
-            final_parameters = self.merge_api_parameters(default_parameters, user_parameters, report_name)
-            
-            # Build full URL with parameters
-            url = f"{base_url}{endpoint}"
+            if user_parameters:
+                # Merge user parameters with default parameters
+                final_parameters = self.merge_api_parameters(default_parameters, user_parameters, report_name)
+                url = f"{base_url}{endpoint}"
+            else:
+                # Default parameters only - the query string is already built
+                final_parameters = None
+                url = DIRECT_API_URLS[report_name]
             
             self.log_message(f"Direct API Endpoint: {url}", 'api')
             self.log_message(f"Required Permission: {required_permission}", 'info')
-            self.log_message(f"Final API Parameters: {final_parameters}", 'debug')
+            self.log_message(f"Final API Parameters: {final_parameters or default_parameters}", 'debug')
             
             # Debug: Check token permissions
             self.debug_token_permissions()
@@ -4034,7 +4586,6 @@ Export first, choose columns later!"""
                                 self.log_message(f"First item keys: {list(items[0].keys()) if items[0] else 'No keys'}", 'debug')
                             
                             # Convert to DataFrame
-                            import pandas as pd
                             df = pd.DataFrame(items)
                             self.log_message(f"Created DataFrame with shape: {df.shape}", 'debug')
                             
@@ -4072,7 +4623,7 @@ Export first, choose columns later!"""
         finally:
             # Re-enable export button and stop progress
             self.log_message("Direct API thread finishing - restoring UI state", 'debug')
-            self.root.after(0, lambda: self.export_btn.config(state='normal'))
+            self.root.after(0, lambda: self.set_export_enabled(True))
             self.root.after(0, lambda: self.progress.stop())
             self.root.after(0, lambda: self.progress_label.config(text="Ready"))
     
@@ -4163,9 +4714,6 @@ Export first, choose columns later!"""
     def debug_token_permissions(self):
         """Debug method to check what permissions the current token has"""
         try:
-            import base64
-            import json
-            
             if not self.access_token:
                 self.log_message("No access token available for permission debugging", 'warning')
                 return
@@ -4241,8 +4789,9 @@ Export first, choose columns later!"""
                         # Try to learn from the error and retry once
                         self.log_message(f"API parameter error detected. Attempting smart retry...", 'warning')
                         
-                        learned_params = self.learn_from_error(report_name, response.json() if response.text else {})
-                        if learned_params:
+                        learned = self.learn_from_error(report_name, response.json() if response.text else {})
+                        if learned:
+                            learned_params = learned[1]
                             # Retry with learned parameters (regardless of whether it's in report_parameters)
                             self.log_message(f"Retrying {report_name} with learned parameters: {list(learned_params.keys())}", 'info')
                             self.root.after(0, lambda: self.progress_label.config(text="Retrying with corrected parameters..."))
@@ -4346,11 +4895,11 @@ Export first, choose columns later!"""
                                 
                                 try:
                                     # The download URL from Microsoft is pre-authenticated and doesn't need our Bearer token
-                                    # Use direct requests call instead of our authenticated method
+                                    # Use the shared session directly instead of our authenticated method
                                     timeout = self.timeout_manager.get_timeout_for_operation('file_download')
                                     self.log_message(f"Downloading from pre-authenticated URL (timeout: {timeout}s)", 'info')
                                     
-                                    download_response = requests.get(download_url, timeout=timeout)
+                                    download_response = self.session.get(download_url, timeout=timeout)
                                     
                                     self.log_message(f"Download response status: {download_response.status_code}", 'api')
                                     
@@ -4408,7 +4957,7 @@ Export first, choose columns later!"""
         finally:
             # Re-enable export button and stop progress
             self.log_message("Export thread finishing - restoring UI state", 'debug')
-            self.root.after(0, lambda: self.export_btn.config(state='normal'))
+            self.root.after(0, lambda: self.set_export_enabled(True))
             self.root.after(0, lambda: self.progress.stop())
             self.root.after(0, lambda: self.progress_label.config(text="Ready"))
     
@@ -4466,7 +5015,6 @@ Export first, choose columns later!"""
                     self.log_message(f"Applying post-processing filters to export job data...", 'info')
                     
                     # Convert to DataFrame for filtering
-                    import pandas as pd
                     df = pd.DataFrame(self.current_export_data)
                     
                     # Apply the same filtering logic as direct API reports
@@ -4530,27 +5078,53 @@ Export first, choose columns later!"""
         }
         
         prefix = prefixes.get(tag, '[INFO]')
-        log_message = f"[{timestamp}] {prefix} {message}\n"
+        self.log_queue.put((f"[{timestamp}] {prefix} {message}\n", tag))
         
-        def update():
-            # Check if console exists and is still valid before trying to log
-            try:
-                if (hasattr(self, 'console_text') and self.console_text and 
-                    self.console_text.winfo_exists()):
-                    self.console_text.insert(tk.END, log_message, tag)
-                    if hasattr(self, 'auto_scroll') and self.auto_scroll.get():
-                        self.console_text.see(tk.END)
-                else:
-                    # Fallback to print if console not available
-                    print(log_message.strip())
-            except (tk.TclError, AttributeError):
-                # Widget was destroyed or invalid, fallback to print
-                print(log_message.strip())
+        # Messages are written in batches - one console insert per flush instead of one per line
+        if not hasattr(self, 'root'):
+            self.flush_log()
+            return
+        with self.log_flush_lock:
+            if self.log_flush_scheduled:
+                return
+            self.log_flush_scheduled = True
+        self.root.after(self.LOG_FLUSH_DELAY_MS, self.flush_log)
+    
+    def flush_log(self):
+        """Write all buffered log messages to the console in one insert"""
+        # Clear the flag before draining so messages logged meanwhile schedule a new flush
+        with self.log_flush_lock:
+            self.log_flush_scheduled = False
+        pending = []
+        try:
+            while True:
+                pending.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if not pending:
+            return
         
-        if hasattr(self, 'root'):
-            self.root.after(0, update)
-        else:
-            update()
+        # Check if console exists and is still valid before trying to log
+        try:
+            if (hasattr(self, 'console_text') and self.console_text and 
+                self.console_text.winfo_exists()):
+                # Text.insert takes alternating text/tag arguments
+                self.console_text.insert(tk.END, *(part for entry in pending for part in entry))
+                
+                # Keep the console bounded - trim in one delete once it overshoots by 10%
+                line_count = int(self.console_text.index('end-1c').split('.')[0])
+                if line_count > self.MAX_CONSOLE_LINES * 1.1:
+                    self.console_text.delete('1.0', f'{line_count - self.MAX_CONSOLE_LINES}.0')
+                if hasattr(self, 'auto_scroll') and self.auto_scroll.get():
+                    self.console_text.see(tk.END)
+                return
+        except (tk.TclError, AttributeError):
+            # Widget was destroyed or invalid, fallback to print below
+            pass
+        
+        # Fallback to print if console not available
+        for text, _ in pending:
+            print(text.strip())
     
     def clear_console(self):
         """Clear console log"""
@@ -4597,10 +5171,7 @@ Export first, choose columns later!"""
     def export_to_powerbi_old_complex_version(self):
         """Export selected columns to PowerBI Desktop and open directly"""
         # Get selected columns
-        selected_columns = []
-        for column, var in self.column_vars.items():
-            if var.get():
-                selected_columns.append(column)
+        selected_columns = self.get_selected_columns()
         
         if not selected_columns:
             messagebox.showwarning("No Columns Selected", "Please select at least one column")
@@ -4612,7 +5183,6 @@ Export first, choose columns later!"""
             self.powerbi_btn.config(state='disabled', text="⚡ Opening...")
             self.root.update()
             
-            import subprocess
             import platform
             
             # Create CSV in user's Documents folder for easy access
@@ -4628,12 +5198,9 @@ Export first, choose columns later!"""
             
             # Write CSV file with error checking
             with open(csv_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=selected_columns)
-                writer.writeheader()
-                
-                for row in self.current_export_data:
-                    filtered_row = {col: row.get(col, '') for col in selected_columns}
-                    writer.writerow(filtered_row)
+                writer = csv.writer(csvfile)
+                writer.writerow(selected_columns)
+                writer.writerows(map(make_row_projector(selected_columns), self.current_export_data))
             
             # Verify file was created successfully
             if not os.path.exists(csv_path):
@@ -4719,8 +5286,6 @@ Export first, choose columns later!"""
     def create_powerbi_template(self, csv_path, selected_columns):
         """Create a PowerBI template file for automated CSV import"""
         try:
-            import json
-            import zipfile
             import tempfile
             
             # PowerBI template folder
@@ -4760,10 +5325,7 @@ in
     def automate_csv_import(self, csv_path):
         """Attempt to automate CSV import in PowerBI using various methods"""
         try:
-            import time
-            
             # Method 1: Copy CSV path to clipboard for easy access
-            import subprocess
             subprocess.run(['powershell', '-command', f'Set-Clipboard -Value "{csv_path}"'], check=True, capture_output=True)
             self.log_message(f"CSV path copied to clipboard: {csv_path}", 'success')
             
@@ -4829,16 +5391,12 @@ in
     def install_automation_library(self):
         """Install pyautogui for PowerBI automation"""
         try:
-            import subprocess
-            import sys
-            
             self.log_message("Installing PyAutoGUI for enhanced automation...", 'info')
             
             # Run pip install in a separate thread to avoid blocking UI
             def install_thread():
                 try:
                     # Use a more compatible approach for Python 3.13
-                    import os
                     result = os.system(f'"{sys.executable}" -m pip install pyautogui')
                     if result == 0:
                         self.log_message("PyAutoGUI installed successfully!", 'success')
@@ -4854,7 +5412,6 @@ in
                     messagebox.showerror("Installation Error", 
                         f"Error installing PyAutoGUI:\n{str(e)}")
             
-            import threading
             thread = threading.Thread(target=install_thread)
             thread.daemon = True
             thread.start()
@@ -4870,7 +5427,6 @@ in
             self.powerbi_btn.config(state='disabled', text="📊 Opening...")
             self.root.update_idletasks()  # Use update_idletasks instead of update to prevent zoom issues
             
-            import subprocess
             import platform
             
             if platform.system() == "Windows":
@@ -4949,7 +5505,6 @@ in
             odata_url = "https://fef.msua08.manage.microsoft.com/ReportingService/DataWarehouseFEService?api-version=v1.0"
             
             # Copy to clipboard using PowerShell
-            import subprocess
             subprocess.run([
                 'powershell', '-Command', 
                 f'Set-Clipboard -Value "{odata_url}"'
@@ -5168,7 +5723,6 @@ An unexpected error occurred.
     def show_odata_info(self, report_name, odata_url, download_url, job_id):
         """Show OData feed information to the user"""
         # Copy URLs to clipboard
-        import subprocess
         clipboard_content = f"OData URL: {odata_url}\nDownload URL: {download_url}\nJob ID: {job_id}"
         
         try:
@@ -5205,7 +5759,6 @@ An unexpected error occurred.
         export_jobs_url = f"{base_graph_url}/exportJobs"
         
         # Copy to clipboard
-        import subprocess
         clipboard_content = f"""Microsoft Graph OData Endpoints:
 Metadata: {odata_metadata_url}
 Export Jobs: {export_jobs_url}
@@ -5238,7 +5791,6 @@ Report: {report_name}"""
     def open_powerbi_folder(self, folder_path):
         """Open the PowerBI imports folder in Windows Explorer"""
         try:
-            import subprocess
             # Open the folder in Windows Explorer
             subprocess.Popen(f'explorer "{folder_path}"', shell=True)
             self.log_message(f"Opened folder: {folder_path}", 'success')
@@ -5330,13 +5882,25 @@ Data Summary:
             self.update_toggle_appearance()
     
     def run(self):
-        """Start the application"""
+        """Build the GUI and start the application"""
+        # The Tk root is only created here, so constructing the app stays cheap
+        self.create_gui()
         try:
             self.root.mainloop()
         except KeyboardInterrupt:
             pass
         except Exception as e:
             messagebox.showerror("Application Error", f"Application error: {str(e)}")
+        finally:
+            self.shutdown_executor()
+    
+    def shutdown_executor(self):
+        """Stop the worker pool without waiting on fetches that are still queued"""
+        try:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+        except TypeError:
+            # Python 3.8 has no cancel_futures
+            self.executor.shutdown(wait=False)
 
 class ReadmeWindow:
     """README window with comprehensive documentation"""
@@ -5755,12 +6319,11 @@ def main():
     try:
         print("🚀 Starting Intune Reports GUI...")
         app = IntuneReportsGUI()
-        print("✅ GUI initialized successfully")
+        print("✅ Application initialized successfully")
         app.run()
     except Exception as e:
         try:
             print(f"❌ Error during startup: {str(e)}")
-            import traceback
             traceback.print_exc()
             root = tk.Tk()
             root.withdraw()